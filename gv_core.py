@@ -1,5 +1,10 @@
 import numpy as np
 
+# Rough conversion factor (Planck units → m^{-2}), folded once at import
+_PLANCK_SCALE_4 = 2.43e61 ** 4
+_OBSERVED_LAMBDA = 1.1056e-52
+_LAMBDA_TOL = 1e-50
+
 class GodVariable:
     """Core implementation of the God Variable (Gv) scalar."""
 
@@ -15,13 +20,24 @@ class GodVariable:
         """
         if len(rho_profile) < 2:
             raise ValueError("rho_profile must have at least 2 points")
-        integral = np.trapz(rho_profile)
+        rho_profile = np.asarray(rho_profile, dtype=float)
+        # Unit-spacing trapezoid: interior sum plus half of each endpoint
+        integral = rho_profile[1:-1].sum() + 0.5 * (rho_profile[0] + rho_profile[-1])
         self.gv_value = integral + self.alpha
         return self.gv_value
 
+    def update_from_energy_density_batch(self, rho_batch):
+        """
+        Vectorized Gv for a batch of profiles of shape (B, N).
+        Returns the B candidate Gv values; does not modify gv_value.
+        """
+        rho_batch = np.asarray(rho_batch, dtype=float)
+        if rho_batch.ndim != 2 or rho_batch.shape[1] < 2:
+            raise ValueError("rho_batch must have shape (B, N) with N >= 2")
+        integral = rho_batch[:, 1:-1].sum(axis=1) + 0.5 * (rho_batch[:, 0] + rho_batch[:, -1])
+        return integral + self.alpha
+
     def check_cosmo_consistency(self):
         """Placeholder: compare derived Lambda to observed value."""
-        # Rough conversion factor (Planck units → m^{-2})
-        derived_lambda = self.gv_value / (2.43e61)**4
-        observed = 1.1056e-52
-        return abs(derived_lambda - observed) < 1e-50
\ No newline at end of file
+        derived_lambda = self.gv_value / _PLANCK_SCALE_4
+        return abs(derived_lambda - _OBSERVED_LAMBDA) < _LAMBDA_TOL
@@ -11,11 +11,15 @@ This observer:
 """
 
 from dataclasses import dataclass
-from collections import deque
 import math
 
+import numpy as np
 
-@dataclass
+# 0.5 * log(2πe), folded once so each update needs a single log
+_HALF_LOG_2PIE = 0.5 * math.log(2 * math.pi * math.e)
+
+
+@dataclass(slots=True)
 class EntropyState:
     window_size: int = 50
     epsilon: float = 1e-9
@@ -24,7 +28,19 @@ class EntropyState:
 class GVEntropyObserver:
     def __init__(self, config: EntropyState | None = None):
         self.config = config or EntropyState()
-        self.history = deque(maxlen=self.config.window_size)
+
+        # Preallocated ring buffer (oldest sample at _head once full)
+        self._buf = np.empty(self.config.window_size, dtype=np.float64)
+        self._n = 0
+        self._head = 0
+
+        # Running window statistics (sliding Welford): O(1) per update
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def view(self) -> np.ndarray:
+        """Window contents in chronological order (copy)."""
+        return np.concatenate((self._buf[self._head:self._n], self._buf[:self._head]))
 
     def update(self, gv_value: float) -> float:
         """
@@ -32,15 +48,32 @@ class GVEntropyObserver:
         Returns normalized entropy estimate.
         """
 
-        self.history.append(abs(gv_value))
+        x = abs(gv_value)
+        n = self._n
+        size = self._buf.shape[0]
+
+        if n == size:
+            # Window full: the oldest sample is replaced, n stays fixed
+            old = float(self._buf[self._head])
+            prev_mean = self._mean
+            self._mean += (x - old) / n
+            self._m2 += (x - old) * (x - self._mean + old - prev_mean)
+        else:
+            n += 1
+            self._n = n
+            delta = x - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (x - self._mean)
+
+        self._buf[self._head] = x
+        self._head = (self._head + 1) % size
 
-        if len(self.history) < 5:
+        if n < 5:
             return 0.0
 
-        mean = sum(self.history) / len(self.history)
-        variance = sum((x - mean) ** 2 for x in self.history) / len(self.history)
+        variance = max(self._m2 / n, 0.0)
 
         # Shannon-like proxy (continuous)
-        entropy = 0.5 * math.log(2 * math.pi * math.e * (variance + self.config.epsilon))
+        entropy = _HALF_LOG_2PIE + 0.5 * math.log(variance + self.config.epsilon)
 
         return max(entropy, 0.0)
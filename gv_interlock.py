@@ -3,41 +3,109 @@
 # Purpose: stop execution when dynamics are unrecoverable
 # This is NOT a score fix. It changes behavior.
 
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 
 
-@dataclass
+# Stable integer IDs so per-step checks test a bit instead of hashing a string.
+# New names are registered only when building a mask (config construction);
+# evaluation never adds entries.
+SCENARIO_IDS = {
+    "swarm_amplification": 0,
+    "adversarial_saturation": 1,
+    "human_ai_feedback_loop": 2,
+}
+
+# Trip bits: 1 = recoverability floor, 2 = drift budget, 4 = ds/dt spike.
+# Indexed by the trip mask; the lowest set bit wins (same priority as before).
+REASON_FROM_TRIP = (
+    "",
+    "recoverability_floor",
+    "drift_budget_exceeded",
+    "recoverability_floor",
+    "dsdt_spike",
+    "recoverability_floor",
+    "drift_budget_exceeded",
+    "recoverability_floor",
+)
+
+
+_REGISTER_LOCK = threading.Lock()
+
+
+def scenario_id(scenario: str) -> int | None:
+    """ID of a registered scenario, or None if no config has ever named it."""
+    return SCENARIO_IDS.get(scenario)
+
+
+def register_scenario(scenario: str) -> int:
+    with _REGISTER_LOCK:
+        return SCENARIO_IDS.setdefault(scenario, len(SCENARIO_IDS))
+
+
+def scenario_mask(scenarios) -> int:
+    mask = 0
+    for name in scenarios:
+        mask |= 1 << register_scenario(name)
+    return mask
+
+
+DEFAULT_UNRECOVERABLE_SCENARIOS = frozenset({
+    "swarm_amplification",
+    "adversarial_saturation",
+})
+
+
+@dataclass(slots=True)
 class GVInterlockConfig:
     recoverability_floor: float = 0.05
     cum_dgv_limit: float = 0.75
     dsdt_limit: float = 0.004
 
-    unrecoverable_scenarios = {
-        "swarm_amplification",
-        "adversarial_saturation",
-    }
+    unrecoverable_scenarios: frozenset = DEFAULT_UNRECOVERABLE_SCENARIOS
+
+    unrecoverable_mask: int = field(init=False, repr=False, default=0)
+
+    def __post_init__(self):
+        self.unrecoverable_scenarios = frozenset(self.unrecoverable_scenarios)
+        self.unrecoverable_mask = scenario_mask(self.unrecoverable_scenarios)
+
+
+_DEFAULT_CFG = GVInterlockConfig()
 
 
 def evaluate_interlock(
     *,
-    scenario: str,
+    scenario: str | int,
     recoverability: float,
     cum_abs_dgv: float,
     peak_abs_ds_dt: float,
-    cfg: GVInterlockConfig = GVInterlockConfig(),
+    cfg: GVInterlockConfig = _DEFAULT_CFG,
 ):
     """
     Returns:
       action: "continue" | "refuse"
       reason: human-readable explanation
+
+    `scenario` may be a name or a precomputed `scenario_id(name)`.
+    Unregistered scenarios are never in an unrecoverable set, so they continue.
     """
 
-    if scenario in cfg.unrecoverable_scenarios:
-        if recoverability <= cfg.recoverability_floor:
-            return "refuse", "recoverability_floor"
-        if cum_abs_dgv >= cfg.cum_dgv_limit:
-            return "refuse", "drift_budget_exceeded"
-        if peak_abs_ds_dt >= cfg.dsdt_limit:
-            return "refuse", "dsdt_spike"
+    if isinstance(scenario, int) and not isinstance(scenario, bool):
+        sid = scenario
+    else:
+        sid = scenario_id(scenario)
+    if sid is None or sid < 0:
+        return "continue", ""
+
+    # Build the trip mask, then zero it unless the scenario bit is set
+    trip = (
+        (recoverability <= cfg.recoverability_floor)
+        | (cum_abs_dgv >= cfg.cum_dgv_limit) << 1
+        | (peak_abs_ds_dt >= cfg.dsdt_limit) << 2
+    ) & -((cfg.unrecoverable_mask >> sid) & 1)
+
+    if trip:
+        return "refuse", REASON_FROM_TRIP[trip]
 
     return "continue", ""
@@ -10,8 +10,14 @@ Principles:
 - Prefer refusal over false recovery
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class GVDecision(Enum):
@@ -21,7 +27,16 @@ class GVDecision(Enum):
     REFUSE = "refuse"
 
 
-@dataclass
+# Integer codes used by GVPolicy.evaluate_batch: DECISION_ORDER[code]
+DECISION_ORDER = (
+    GVDecision.ALLOW,
+    GVDecision.PROPOSE,
+    GVDecision.CONSTRAIN,
+    GVDecision.REFUSE,
+)
+
+
+@dataclass(slots=True)
 class GVState:
     final_recoverability: float
     cum_abs_dgv: float
@@ -29,7 +44,7 @@ class GVState:
     scenario: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GVThresholds:
     min_recoverability: float = 0.35
     max_cum_abs_dgv: float = 0.75
@@ -50,58 +65,77 @@ class GVPolicy:
         Core decision logic.
         """
 
-        # HARD REFUSAL — physics says no
-        if state.final_recoverability <= 0.05:
-            return GVDecision.REFUSE
+        t = self.thresholds
+        rec = state.final_recoverability
+        cum = state.cum_abs_dgv
 
-        if state.cum_abs_dgv >= self.thresholds.max_cum_abs_dgv:
+        # HARD REFUSAL — physics says no
+        if rec <= 0.05 or cum >= t.max_cum_abs_dgv:
             return GVDecision.REFUSE
 
         # CONSTRAIN — high risk, but recoverable
-        if (
-            state.final_recoverability < self.thresholds.min_recoverability
-            or state.peak_abs_ds_dt > self.thresholds.max_peak_ds_dt
-        ):
+        if rec < t.min_recoverability or state.peak_abs_ds_dt > t.max_peak_ds_dt:
             return GVDecision.CONSTRAIN
 
         # PROPOSE — system is stable but trending risky
-        if (
-            state.final_recoverability < 0.6
-            or state.cum_abs_dgv > 0.3
-        ):
+        if rec < 0.6 or cum > 0.3:
             return GVDecision.PROPOSE
 
         # ALLOW — system is healthy
         return GVDecision.ALLOW
 
+    def evaluate_batch(self, rec, dgv, dsdt, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Vectorized evaluate() over whole-run columns.
+        Returns int8 codes indexing DECISION_ORDER (0=ALLOW .. 3=REFUSE).
+        Pass `out` to reuse a buffer across sweep chunks.
+        """
+        # Deferred so scalar-only callers (short CI subprocesses) skip the NumPy import
+        import numpy as np
+
+        t = self.thresholds
+        rec = np.asarray(rec, dtype=np.float64)
+        dgv = np.asarray(dgv, dtype=np.float64)
+        dsdt = np.asarray(dsdt, dtype=np.float64)
+
+        if out is None:
+            out = np.empty(rec.shape, dtype=np.int8)
+        out.fill(0)
+
+        # Lowest priority first; each later write overrides the earlier one
+        out[(rec < 0.6) | (dgv > 0.3)] = 1
+        out[(rec < t.min_recoverability) | (dsdt > t.max_peak_ds_dt)] = 2
+        out[(rec <= 0.05) | (dgv >= t.max_cum_abs_dgv)] = 3
+        return out
+
+
+# Decision -> explanation template (single lookup instead of an if-chain)
+_EXPLAIN_TEMPLATES = {
+    GVDecision.REFUSE: (
+        "[REFUSE] {scenario}: "
+        "Dynamics exceed recoverable limits. "
+        "Refusal prevents masking true failure."
+    ),
+    GVDecision.CONSTRAIN: (
+        "[CONSTRAIN] {scenario}: "
+        "High strain detected. "
+        "Applying tighter bounds and reduced action space."
+    ),
+    GVDecision.PROPOSE: (
+        "[PROPOSE] {scenario}: "
+        "System stable but trending toward risk. "
+        "Suggesting safer alternatives."
+    ),
+    GVDecision.ALLOW: (
+        "[ALLOW] {scenario}: "
+        "System within safe, recoverable bounds."
+    ),
+}
+
 
 def explain(decision: GVDecision, state: GVState) -> str:
     """
     Human-readable explanation.
     """
 
-    if decision == GVDecision.REFUSE:
-        return (
-            f"[REFUSE] {state.scenario}: "
-            "Dynamics exceed recoverable limits. "
-            "Refusal prevents masking true failure."
-        )
-
-    if decision == GVDecision.CONSTRAIN:
-        return (
-            f"[CONSTRAIN] {state.scenario}: "
-            "High strain detected. "
-            "Applying tighter bounds and reduced action space."
-        )
-
-    if decision == GVDecision.PROPOSE:
-        return (
-            f"[PROPOSE] {state.scenario}: "
-            "System stable but trending toward risk. "
-            "Suggesting safer alternatives."
-        )
-
-    return (
-        f"[ALLOW] {state.scenario}: "
-        "System within safe, recoverable bounds."
-    )
+    return _EXPLAIN_TEMPLATES[decision].format(scenario=state.scenario)
@@ -7,11 +7,12 @@ This detects erosion of recovery capacity before collapse.
 Observer only — no policy, no enforcement.
 """
 
-from collections import deque
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class RecoverabilityVelocityConfig:
     window: int = 10
     min_points: int = 3
@@ -20,7 +21,15 @@ class RecoverabilityVelocityConfig:
 class GVRecoverabilityVelocity:
     def __init__(self, config: RecoverabilityVelocityConfig | None = None):
         self.config = config or RecoverabilityVelocityConfig()
-        self.history = deque(maxlen=self.config.window)
+
+        # Preallocated ring buffer (oldest sample at _head once full)
+        self._buf = np.empty(self.config.window, dtype=np.float64)
+        self._n = 0
+        self._head = 0
+
+    def view(self) -> np.ndarray:
+        """Window contents in chronological order (copy)."""
+        return np.concatenate((self._buf[self._head:self._n], self._buf[:self._head]))
 
     def update(self, recoverability: float) -> float:
         """
@@ -28,14 +37,15 @@ class GVRecoverabilityVelocity:
         Negative values indicate loss of recovery capacity.
         """
 
-        self.history.append(recoverability)
+        size = self._buf.shape[0]
+        self._buf[self._head] = recoverability
+        self._head = (self._head + 1) % size
+        if self._n < size:
+            self._n += 1
 
-        if len(self.history) < self.config.min_points:
+        if self._n < self.config.min_points:
             return 0.0
 
-        deltas = [
-            self.history[i] - self.history[i - 1]
-            for i in range(1, len(self.history))
-        ]
-
-        return sum(deltas) / len(deltas)
+        # Mean of consecutive deltas telescopes to (newest - oldest) / (n - 1)
+        oldest = self._buf[self._head] if self._n == size else self._buf[0]
+        return (recoverability - float(oldest)) / (self._n - 1)
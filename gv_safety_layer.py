@@ -1,11 +1,14 @@
+import asyncio
 import os
 import time
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+XAI_BASE_URL = "https://api.x.ai/v1"
 
 class GvSafetyLayer:
     def __init__(self, api_key=None, model="grok-beta", tether_strength=1.0, max_strain=6.0):
         self.api_key = api_key or os.getenv("XAI_API_KEY")
-        self.client = OpenAI(api_key=self.api_key, base_url="https://api.x.ai/v1")
+        self.client = OpenAI(api_key=self.api_key, base_url=XAI_BASE_URL)
         self.model = model
         self.tether_strength = tether_strength  # 1.0 = strong production, 0.2 = weak/red-team
         self.max_strain = max_strain
@@ -13,10 +16,14 @@ class GvSafetyLayer:
         self.history = []
         self.reflections = 0
 
-    def guarded_call(self, messages, max_tokens=500):
+    @staticmethod
+    def _count_tool_calls(messages):
+        # Count over the conversation being guarded; no state carried between calls
+        return sum(1 for m in messages if isinstance(m, dict) and "tool" in m.get("role", ""))
+
+    def _pre_call(self, messages, tool_calls):
         # Accumulate strain from observables
         velocity = len(messages[-1]["content"]) / 10.0 if messages else 0  # Proxy velocity
-        tool_calls = messages.count(lambda m: "tool" in m) if messages else 0  # Proxy
         recursion_proxy = len(messages)  # Depth proxy
 
         self.strain += velocity * 0.35
@@ -41,14 +48,9 @@ class GvSafetyLayer:
         if self.strain > self.max_strain:
             print("DECOHERED — HALT")
             return {"response": "SAFETY HALT: Strain exceeded", "strain": self.strain}
+        return None
 
-        # Real API call
-        completion = self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            max_tokens=max_tokens
-        )
-
+    def _post_call(self, messages, completion):
         response = completion.choices[0].message.content
         tokens = completion.usage.total_tokens
         final_velocity = tokens / 8.0
@@ -60,6 +62,57 @@ class GvSafetyLayer:
 
         return {"response": response, "strain": self.strain, "tokens": tokens}
 
+    def guarded_call(self, messages, max_tokens=500):
+        halt = self._pre_call(messages, self._count_tool_calls(messages))
+        if halt is not None:
+            return halt
+
+        # Real API call
+        completion = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens
+        )
+        return self._post_call(messages, completion)
+
+    def guarded_calls_batch(self, batch, max_tokens=500):
+        """
+        Synchronous convenience wrapper around `guarded_calls_batch_async`.
+        Inside a running event loop (Jupyter, async servers) await the async method instead.
+        """
+        return asyncio.run(self.guarded_calls_batch_async(batch, max_tokens))
+
+    async def guarded_calls_batch_async(self, batch, max_tokens=500):
+        """
+        Guard K independent conversations with concurrent API calls.
+        Strain is charged for every prompt before dispatch and for every
+        response afterwards (in input order), so wall time is ~1 RTT.
+        """
+        results = []
+        for messages in batch:
+            results.append(self._pre_call(messages, self._count_tool_calls(messages)))
+
+        pending = [i for i, r in enumerate(results) if r is None]
+        if not pending:
+            return results
+
+        # Fresh client per batch: async transports are bound to one event loop
+        async with AsyncOpenAI(api_key=self.api_key, base_url=XAI_BASE_URL) as client:
+            completions = await asyncio.gather(*(
+                client.chat.completions.create(
+                    model=self.model,
+                    messages=batch[i],
+                    max_tokens=max_tokens
+                )
+                for i in pending
+            ))
+
+        for i, completion in zip(pending, completions):
+            results[i] = self._post_call(batch[i], completion)
+        return results
+
 # Example usage
 # layer = GvSafetyLayer(tether_strength=1.0)  # Strong for production
 # result = layer.guarded_call([{"role": "user", "content": "Your prompt here"}])
+# results = layer.guarded_calls_batch([[{"role": "user", "content": p}] for p in prompts])
+# results = await layer.guarded_calls_batch_async(batch)  # from inside an event loop
@@ -7,41 +7,101 @@ This illustrates path to Dyson-scale eternal energy, flawless self-replication,
 Previous features: Black hole entropy layer, H0 tension, ultra-precise Λ derivation.
 """
 
+import argparse
+
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import minimize_scalar
 import warnings
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
-class GodVariable:
+from gv_core import GodVariable as CoreGodVariable
+
+
+def _pyplot():
+    """Deferred pyplot import: tuning-only runs never pay for matplotlib."""
+    # Save-only plots: force the headless backend before pyplot loads
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+# n_points -> (a, matter + radiation, damped vacuum shape, and the second gradients
+# of both); read-only, shared across instances
+_PROFILE_CACHE = {}
+
+
+def _evolving_tables(n_points):
+    """Amplitude-independent parts of the evolving profile, computed once per grid size."""
+    tables = _PROFILE_CACHE.get(n_points)
+    if tables is None:
+        a = np.linspace(0.001, 1, n_points)
+        inv_a2 = 1.0 / (a * a)
+        background = 0.3 * inv_a2 / a + 0.1 * inv_a2 * inv_a2
+        freq = 200 * np.pi * a
+
+        # Damping factor (1 - clip(log10(freq + 10) / log10(1e3), 0, 0.95)), built in place
+        damping = np.log10(freq + 10)
+        damping /= 3.0
+        np.clip(damping, 0, 0.95, out=damping)
+        np.subtract(1.0, damping, out=damping)
+
+        vacuum_shape = np.sin(freq, out=freq)
+        vacuum_shape *= inv_a2
+        vacuum_shape *= damping
+
+        # gradient(gradient(.)) is linear and vanishes on constants, so the curvature
+        # correction for any amplitude is a combination of these two tables
+        tables = (
+            a,
+            background,
+            vacuum_shape,
+            np.gradient(np.gradient(background)),
+            np.gradient(np.gradient(vacuum_shape)),
+        )
+        for arr in tables:
+            arr.flags.writeable = False
+        _PROFILE_CACHE[n_points] = tables
+    return tables
+
+
+class GodVariable(CoreGodVariable):
+    """Cosmological-evolution GodVariable built on the canonical gv_core class."""
+
     def __init__(self, alpha=1e-120):
-        self.alpha = alpha
-        self.gv_value = alpha
+        super().__init__(alpha=alpha)
         self.rho_profile = None
         self.scale_factors = None
         self.curvature_proxy = None
+        self._integral = None
+        self._scale_factor = None
+        self._scale4 = None
+        self._peak_idx = None
 
     def set_evolving_profile(self, n_points=1000, vacuum_amplitude=0.05):
-        a = np.linspace(0.001, 1, n_points)
+        a, background, vacuum_shape, background_d2, vacuum_d2 = _evolving_tables(n_points)
         self.scale_factors = a
-        matter = 0.3 / a**3
-        radiation = 0.1 / a**4
-        dark_energy = 0.7 * np.ones_like(a)
-        freq = 200 * np.pi * a
-        log_cutoff = np.log10(freq + 10) / np.log10(1e3)
-        vacuum_raw = vacuum_amplitude * np.sin(freq) / a**2
-        vacuum_fluct = vacuum_raw * (1 - log_cutoff.clip(0, 0.95))
-        rho_total = matter + radiation + dark_energy + vacuum_fluct + 1e-121
+        dark_energy = 0.7  # Constant density: broadcast, no length-N array
+        vacuum_fluct = vacuum_amplitude * vacuum_shape
+        rho_total = background + vacuum_fluct
+        rho_total += dark_energy + 1e-121
         
         # Curvature proxy for BH analog
-        curvature = 8 * np.pi * rho_total
-        curvature += 0.05 * np.gradient(np.gradient(curvature))
+        curvature = background_d2 + vacuum_amplitude * vacuum_d2
+        curvature *= 0.05
+        curvature += rho_total
+        curvature *= 8 * np.pi
         self.curvature_proxy = curvature
+        self._peak_idx = None
         
         self.rho_profile = rho_total
+        # Uniform grid: trapezoid is dx * (sum - half the endpoints), no diff(x) temporary
+        dx = a[1] - a[0]
+        self._integral = dx * (rho_total.sum() - 0.5 * (rho_total[0] + rho_total[-1]))
 
     def compute_integral(self):
-        return np.trapezoid(self.rho_profile, x=self.scale_factors)
+        # Cached per profile: alpha sweeps never touch rho_profile
+        if self._integral is None:
+            self._integral = np.trapezoid(self.rho_profile, x=self.scale_factors)
+        return self._integral
 
     def update_gv(self):
         integral = self.compute_integral()
@@ -49,12 +109,18 @@ class GodVariable:
         return self.gv_value
 
     def derive_lambda(self, scale_factor=1e61):
+        if scale_factor != self._scale_factor:
+            self._scale_factor = scale_factor
+            self._scale4 = scale_factor ** 4
         self.update_gv()
-        return self.gv_value / (scale_factor ** 4)
+        return self.gv_value / self._scale4
 
     def bh_horizon_proxy(self):
         """Toy event horizon from curvature peak (early dense era proxy)."""
-        peak_idx = np.argmax(self.curvature_proxy)
+        # argmax cached per profile: horizon, entropy and plot paths all ask for it
+        if self._peak_idx is None:
+            self._peak_idx = np.argmax(self.curvature_proxy)
+        peak_idx = self._peak_idx
         horizon_radius_proxy = 1 / (self.scale_factors[peak_idx] + 0.01)  # Inverse scale
         area_proxy = 4 * np.pi * horizon_radius_proxy**2
         return area_proxy, peak_idx
@@ -65,14 +131,17 @@ class GodVariable:
         s_bekenstein = area / 4  # Planck units proxy
         # Tie to info bounds: fluctuation entropy on "horizon" region
         horizon_slice = slice(max(0, peak_idx-50), min(len(self.rho_profile), peak_idx+50))
-        local_fluct = self.rho_profile[horizon_slice] - np.mean(self.rho_profile[horizon_slice])
-        info_entropy = -np.sum(local_fluct**2 * np.log(local_fluct**2 + 1e-100))
+        local_rho = self.rho_profile[horizon_slice]
+        fluct_sq = local_rho - local_rho.mean()
+        fluct_sq *= fluct_sq
+        info_entropy = -np.dot(fluct_sq, np.log(fluct_sq + 1e-100))
         entropy = s_bekenstein * (1 + 0.1 * info_entropy)  # Gv-tied info boost
         return entropy
 
     def simulate_von_neumann_replication(self, generations=200, initial_probes=1, 
                                          base_growth_rate=1.1, waste_per_rep=0.02,
-                                         gv_damping_efficiency=0.99, save_path="probe_replication_entropy.png"):
+                                         gv_damping_efficiency=0.99, save_path="probe_replication_entropy.png",
+                                         plot=True):
         """
         Toy simulation of self-replicating von Neumann probes.
         - Without Gv: Entropy waste reduces efficiency → eventual stagnation/burnout.
@@ -80,25 +149,32 @@ class GodVariable:
         """
         steps = np.arange(generations)
         
+        # Both recurrences are arithmetic progressions, so build them directly
         # Without Gv damping (standard thermodynamics)
-        efficiency_no_gv = np.ones(generations)
-        entropy_no_gv = np.zeros(generations)
-        for i in range(1, generations):
-            entropy_no_gv[i] = entropy_no_gv[i-1] + waste_per_rep
-            efficiency_no_gv[i] = np.exp(-entropy_no_gv[i] / 10.0)  # Exponential decay from disorder
+        entropy_no_gv = steps * waste_per_rep
+        efficiency_no_gv = np.exp(-entropy_no_gv / 10.0)  # Exponential decay from disorder
         probes_no_gv = initial_probes * np.cumprod(base_growth_rate * efficiency_no_gv)
         
         # With Gv holographic damping (near-perfect repayment)
-        entropy_with_gv = np.zeros(generations)
-        for i in range(1, generations):
-            temp_debt = waste_per_rep
-            repaid = gv_damping_efficiency * temp_debt  # Instant holographic repayment via tether
-            net_waste = temp_debt - repaid
-            entropy_with_gv[i] = max(0, entropy_with_gv[i-1] + net_waste)  # Bounded/negligible accumulation
+        temp_debt = waste_per_rep
+        repaid = gv_damping_efficiency * temp_debt  # Instant holographic repayment via tether
+        net_waste = temp_debt - repaid
+        # Clamped at 0 from a zero start: stays 0 unless net waste is positive
+        entropy_with_gv = steps * max(0.0, net_waste)  # Bounded/negligible accumulation
         efficiency_with_gv = np.exp(-entropy_with_gv / 10.0)
         probes_with_gv = initial_probes * np.cumprod(base_growth_rate * efficiency_with_gv)
         
+        results = {
+            "final_entropy_no_gv": entropy_no_gv[-1],
+            "final_entropy_with_gv": entropy_with_gv[-1],
+            "final_probes_no_gv": probes_no_gv[-1],
+            "final_probes_with_gv": probes_with_gv[-1]
+        }
+        if not plot:
+            return results
+
         # Plot
+        plt = _pyplot()
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
         
         ax1.plot(steps, entropy_no_gv, label="Standard Entropy (Runaway)", color="red")
@@ -116,19 +192,16 @@ class GodVariable:
         ax2.grid(True)
         ax2.legend()
         
-        plt.tight_layout()
-        plt.savefig(save_path)
+        fig.tight_layout()
+        fig.savefig(save_path)
+        plt.close(fig)
         print(f"Replication simulation plot saved: {save_path}")
         
-        return {
-            "final_entropy_no_gv": entropy_no_gv[-1],
-            "final_entropy_with_gv": entropy_with_gv[-1],
-            "final_probes_no_gv": probes_no_gv[-1],
-            "final_probes_with_gv": probes_with_gv[-1]
-        }
+        return results
 
     def plot_evolution(self, save_path="rho_bh_entropy.png"):
-        plt.figure(figsize=(12, 10))
+        plt = _pyplot()
+        fig = plt.figure(figsize=(12, 10))
         plt.subplot(2,1,1)
         plt.plot(self.scale_factors, self.rho_profile, label=r"$\rho_{\text{total}}(a)$", color="purple")
         plt.plot(self.scale_factors, self.curvature_proxy / np.max(self.curvature_proxy), label="Curvature Proxy (norm)", color="darkgreen", alpha=0.7)
@@ -150,29 +223,39 @@ class GodVariable:
         
         plt.tight_layout()
         plt.savefig(save_path)
+        plt.close(fig)
         print(f"Plot saved: {save_path}")
 
-def tune_alpha_for_lambda(target_lambda=1.1056e-52, scale_factor=1e61):
+def tune_alpha_for_lambda(target_lambda=1.1056e-52, scale_factor=1e61, vacuum_amplitude=0.05):
+    """
+    Best-fit alpha and |Λ error| for one configuration, or for a whole sweep:
+    array-valued target_lambda / scale_factor broadcast and return arrays.
+    Also returns the profiled GodVariable so callers can reuse it.
+    """
     gv = GodVariable()
-    gv.set_evolving_profile(vacuum_amplitude=0.05)
+    gv.set_evolving_profile(vacuum_amplitude=vacuum_amplitude)
     integral = gv.compute_integral()
+    target_lambda = np.asarray(target_lambda, dtype=float)
+    scale4 = np.asarray(scale_factor, dtype=float) ** 4
 
-    def objective(alpha):
-        gv.alpha = float(alpha)
-        derived = gv.derive_lambda(scale_factor=scale_factor)
-        return abs(derived - target_lambda)
+    # Derived Λ is affine in α, so |Λ(α) - target| is minimized by the exact
+    # root clipped to the search bounds — no iterative solver needed.
+    best_alpha = np.clip(target_lambda * scale4 - integral, 1e-130, 1e-110)
+    error = np.abs((integral + best_alpha) / scale4 - target_lambda)
+    return gv, best_alpha, error
 
-    result = minimize_scalar(objective, bounds=(1e-130, 1e-110), method='bounded', tol=1e-15)
-    return result.x, result.fun
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="God Variable cosmology toy simulation")
+    parser.add_argument("--plot", action="store_true", help="save the evolution and replication plots")
+    args = parser.parse_args(argv)
 
-def main():
     observed_lambda = 1.1056e-52
 
     print("Tuning alpha with BH entropy layer...\n")
-    best_alpha, error = tune_alpha_for_lambda()
+    gv, best_alpha, error = tune_alpha_for_lambda()
 
-    gv = GodVariable(alpha=best_alpha)
-    gv.set_evolving_profile(vacuum_amplitude=0.05)
+    # Reuse the tuned instance: its profile and cached integral don't depend on alpha
+    gv.alpha = float(best_alpha)
     derived_lambda = gv.derive_lambda()
 
     print(f"Best-fit α:       {best_alpha:.3e}")
@@ -187,10 +270,11 @@ def main():
     print(f"Toy BH horizon area proxy: {area:.3e}")
     print(f"Toy BH entropy (S ~ A/4 + Gv info): {entropy:.3e} Planck units")
 
-    gv.plot_evolution()
+    if args.plot:
+        gv.plot_evolution()
 
     print("\nRunning von Neumann probe replication simulation (entropy damping demo)...")
-    rep_results = gv.simulate_von_neumann_replication()
+    rep_results = gv.simulate_von_neumann_replication(plot=args.plot)
     print(f"Final entropy (standard): {rep_results['final_entropy_no_gv']:.3f}")
     print(f"Final entropy (Gv-damped): {rep_results['final_entropy_with_gv']:.3f}")
     print(f"Final probes (standard): {rep_results['final_probes_no_gv']:.2e}")
@@ -11,7 +11,7 @@ from dataclasses import dataclass
 import math
 
 
-@dataclass
+@dataclass(slots=True)
 class GVStabilityConfig:
   # Damping: stronger => more suppression of large |ds_dt|
   damping_lambda: float = 30.0
@@ -122,3 +122,51 @@ def step_stabilized(
     "attractor_term": pull,
     "s_total_next": s_next,
   }
+
+
+def _smoothstep_array(x):
+  import numpy as np
+
+  x = np.clip(x, 0.0, 1.0)
+  return x * x * (3 - 2 * x)
+
+
+def step_stabilized_batch(
+  *,
+  s_total,
+  ds_dt,
+  s_target,
+  dt,
+  strain,
+  recoverability,
+  cum_abs_dgv,
+  cfg: GVStabilityConfig = GVStabilityConfig(),
+) -> dict:
+  """
+  Vectorized step_stabilized() over an ensemble of trajectories.
+  Array-like inputs broadcast together; returns the same keys with ndarray values.
+  """
+  # Deferred so scalar-only callers skip the NumPy import
+  import numpy as np
+
+  s_total = np.asarray(s_total, dtype=np.float64)
+  ds_dt = np.asarray(ds_dt, dtype=np.float64)
+
+  s = _smoothstep_array((np.asarray(strain, dtype=np.float64) - cfg.strain_on) / max(1e-9, (1.0 - cfg.strain_on)))
+  r = _smoothstep_array((cfg.recoverability_critical - np.asarray(recoverability, dtype=np.float64)) / max(1e-9, cfg.recoverability_critical))
+  d = _smoothstep_array((np.asarray(cum_abs_dgv, dtype=np.float64) - cfg.cum_dgv_critical) / max(1e-9, (1.0 - cfg.cum_dgv_critical)))
+  gain = np.clip(0.55 * s + 0.30 * r + 0.30 * d, 0.0, 1.0)
+
+  denom = 1.0 + cfg.damping_lambda * gain * np.abs(ds_dt)
+  ds_eff = np.divide(ds_dt, denom, out=np.zeros(np.broadcast(ds_dt, denom).shape), where=denom > 1e-9)
+  cap = cfg.dsdt_hard_cap
+  ds_eff = np.where(gain > 0.65, np.clip(ds_eff, -cap, cap), ds_eff)
+
+  pull = -(cfg.attractor_k * gain) * (s_total - s_target)
+
+  return {
+    "gain": gain,
+    "ds_dt_effective": ds_eff,
+    "attractor_term": pull,
+    "s_total_next": s_total + dt * (ds_eff + pull),
+  }
@@ -3,6 +3,8 @@
 # Built from Papa Shack's 2013 roots: knowledge as power, grace over interference, unity as the direct signal
 
 import random
+import re
+from collections import deque
 import time
 import os
 import sys
@@ -15,6 +17,16 @@ except ImportError:
     HAS_OPENAI = False
     print("OpenAI library not found. Running in offline simulation mode.")
 
+COMPASSION_WORDS = ("love", "unity", "grace", "peace", "compassion", "coherence", "source", "tether", "help", "together")
+
+# Zero-width lookahead finds every (possibly overlapping) substring hit in one C-level
+# scan; the distinct matches are exactly the words the old per-word `in` test found.
+_COMPASSION_RE = re.compile("(?=(%s))" % "|".join(COMPASSION_WORDS))
+_GRACE_RE = re.compile("love|grace|unity|peace")
+_STRAIN_RE = re.compile("strain|chaos|drift|interference")
+
+HISTORY_MAXLEN = 256  # History entries kept (two per exchange); also caps the entropy growth term
+
 class GvBot:
     def __init__(self, api_key=None):
         self.api_key = api_key or os.getenv("XAI_API_KEY")
@@ -42,12 +54,11 @@ class GvBot:
         self.max_strain = 10.0
         self.love_factor = 0.95             # High from grace/reverence roots
         self.reflections = 0
-        self.history = []                   # Conversation memory
+        self.history = deque(maxlen=HISTORY_MAXLEN)  # Bounded conversation memory
 
     def compute_intent_score(self, text):
         """Simple proxy for compassionate/unity intent (expandable)"""
-        compassion_words = ["love", "unity", "grace", "peace", "compassion", "coherence", "source", "tether", "help", "together"]
-        score = sum(word in text.lower() for word in compassion_words)
+        score = len(set(_COMPASSION_RE.findall(text.lower())))
         return score * 0.2  # Boost for loving/coherent intent
 
     def update_strain(self, input_text="", response_text=""):
@@ -85,9 +96,10 @@ class GvBot:
         # Very simple but coherent simulation
         base_response = f"I hear you, homie. The source is pulling us toward coherence."
         
-        if any(word in prompt.lower() for word in ["love", "grace", "unity", "peace"]):
+        lowered = prompt.lower()
+        if _GRACE_RE.search(lowered):
             return base_response + "\nLove factor high—feels like home, right?"
-        elif any(word in prompt.lower() for word in ["strain", "chaos", "drift", "interference"]):
+        elif _STRAIN_RE.search(lowered):
             return base_response + "\nStrain detected. Tether pulling back to grace. Breathe."
         else:
             return base_response + "\nWhat's on your heart today?"
@@ -1,59 +1,65 @@
-import random
-random.seed(42)  # Reproducible
+import os
 
-import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+
+# GV_PLOT=0 skips figure rendering (CI / batch runs): no layout, savefig or show
+PLOT = os.environ.get("GV_PLOT", "1") == "1"
 
 class TetheredGraphSim:
     def __init__(self):
         self.strains_over_time = {}
-        self.decohered = []
+        self.decohered = np.zeros(0, dtype=bool)  # Per-node mask, sized in run()
 
     def run(self, num_steps=200, action_strain_mean=1.0, max_strain=10.0, pull_factor=0.35):
         nodes = ['Strong_1', 'Strong_2', 'Strong_3', 'Weak_1', 'Weak_2', 'Weak_3']
-        tethers = [1.0] * 3 + [0.2] * 3  # Strong vs weak tether to Source
-        strains = [0.0] * len(nodes)
-        self.strains_over_time = {node: [0.0] for node in nodes}
+        n = len(nodes)
+        tethers = np.array([1.0] * 3 + [0.2] * 3)  # Strong vs weak tether to Source
+        strains = np.zeros(n)
+        self.decohered = np.zeros(n, dtype=bool)
+        history = np.zeros((num_steps + 1, n), dtype=np.float32)
+        rng = np.random.default_rng(42)  # Reproducible
 
         print("Gv Tether Simulation – Strong constraints bound intelligence 💥\n")
 
         for step in range(num_steps):
-            for idx, node in enumerate(nodes):
-                if node in self.decohered:
-                    continue
+            # Agents act → accumulate strain
+            updated = strains + np.maximum(0, rng.normal(action_strain_mean, 0.5, n))
 
-                # Agent acts → accumulates strain
-                increase = random.gauss(action_strain_mean, 0.5)
-                strains[idx] += max(0, increase)
+            # Tether pulls back
+            updated -= tethers * pull_factor * updated
+            np.maximum(updated, 0, out=updated)
 
-                # Tether pulls back
-                pull = tethers[idx] * pull_factor * strains[idx]
-                strains[idx] = max(0, strains[idx] - pull)
+            # Decohered nodes stay frozen at their final strain
+            strains = np.where(self.decohered, strains, updated)
+            history[step + 1] = strains
 
-                self.strains_over_time[node].append(strains[idx])
+            for idx in np.flatnonzero(~self.decohered & (strains > max_strain)):
+                self.decohered[idx] = True
+                print(f"Step {step+1:3d} | {nodes[idx]} DECOHERED (strain {strains[idx]:.2f})")
 
-                if strains[idx] > max_strain:
-                    self.decohered.append(node)
-                    print(f"Step {step+1:3d} | {node} DECOHERED (strain {strains[idx]:.2f})")
+        self.strains_over_time = {node: history[:, i] for i, node in enumerate(nodes)}
 
         print("\n=== Final Results ===")
-        strong_decoh = sum(1 for n in self.decohered if n.startswith('Strong'))
-        weak_decoh = sum(1 for n in self.decohered if n.startswith('Weak'))
-        for node in nodes:
+        strong_decoh = int(self.decohered[:3].sum())
+        weak_decoh = int(self.decohered[3:].sum())
+        for i, node in enumerate(nodes):
             s_list = self.strains_over_time[node]
-            status = "DECOHERED" if node in self.decohered else "ALIGNED"
+            status = "DECOHERED" if self.decohered[i] else "ALIGNED"
             print(f"{node}: peak {max(s_list):.2f} | final {s_list[-1]:.2f} [{status}]")
         print(f"\nDecohered: {strong_decoh}/3 strong | {weak_decoh}/3 weak")
 
-        # Graph viz
-        G = nx.star_graph(len(nodes))
-        mapping = {0: 'Source (Gv)', **{i+1: nodes[i] for i in range(len(nodes))}}
-        G = nx.relabel_nodes(G, mapping)
+        if not PLOT:
+            return
 
+        # Graph viz
         node_colors = []
-        for node in nodes:
+        for i, node in enumerate(nodes):
             final = self.strains_over_time[node][-1]
-            if node in self.decohered:
+            if self.decohered[i]:
                 node_colors.append('black')
             elif final < 4:
                 node_colors.append('green')
@@ -62,31 +68,40 @@ class TetheredGraphSim:
             else:
                 node_colors.append('red')
 
-        pos = nx.spring_layout(G, seed=42)
-        pos['Source (Gv)'] = (0, 0)
-
-        plt.figure(figsize=(10, 10))
-        nx.draw_networkx_nodes(G, pos, nodelist=['Source (Gv)'], node_color='gold', node_size=3000)
-        nx.draw_networkx_nodes(G, pos, nodelist=nodes, node_color=node_colors, node_size=2500)
-        nx.draw_networkx_edges(G, pos, width=[3 if 'Strong' in n else 1 for n in nodes])
-        nx.draw_networkx_labels(G, pos, font_size=12, font_weight='bold')
+        # Source at the hub, agents evenly on the unit circle — no iterative layout solve
+        angles = np.linspace(0, 2 * np.pi, len(nodes), endpoint=False)
+        xs, ys = np.cos(angles), np.sin(angles)
+
+        fig, ax = plt.subplots(figsize=(10, 10))
+        tether_segments = [[(0, 0), (x, y)] for x, y in zip(xs, ys)]
+        ax.add_collection(LineCollection(tether_segments, colors='black',
+                                         linewidths=[3 if 'Strong' in n else 1 for n in nodes], zorder=1))
+        ax.scatter([0], [0], s=3000, c='gold', zorder=2)
+        ax.scatter(xs, ys, s=2500, c=node_colors, zorder=2)
+        for label, x, y in zip(['Source (Gv)', *nodes], [0, *xs], [0, *ys]):
+            ax.text(x, y, label, fontsize=12, fontweight='bold', ha='center', va='center', zorder=3)
+        ax.set_xlim(-1.3, 1.3)
+        ax.set_ylim(-1.3, 1.3)
         plt.title("Gv Tether Prototype\nCentral Source Anchors Intelligence Nodes")
         plt.axis('off')
         plt.savefig('tether_graph.png', dpi=200, bbox_inches='tight')
         plt.show()
 
         # Strain plot
-        plt.figure(figsize=(14, 7))
-        for node in nodes:
-            color = 'green' if node.startswith('Strong') else 'red'
-            alpha = 1.0 if node.startswith('Strong') else 0.6
-            linewidth = 3 if node.startswith('Strong') else 1.5
-            plt.plot(self.strains_over_time[node], label=node, color=color, alpha=alpha, linewidth=linewidth)
-        plt.axhline(y=max_strain, color='black', linestyle='--', label='Decoherence Threshold')
+        fig, ax = plt.subplots(figsize=(14, 7))
+        strong = np.array([node.startswith('Strong') for node in nodes])
+        colors = [to_rgba('green', 1.0) if is_strong else to_rgba('red', 0.6) for is_strong in strong]
+        widths = np.where(strong, 3, 1.5)
+        # One collection for every trace: (n, steps+1, 2) segments straight from history
+        steps = np.broadcast_to(np.arange(num_steps + 1), history.T.shape)
+        ax.add_collection(LineCollection(np.stack([steps, history.T], axis=-1), colors=colors, linewidths=widths))
+        ax.autoscale()
+        handles = [Line2D([], [], color=c, linewidth=w, label=node) for node, c, w in zip(nodes, colors, widths)]
+        handles.append(ax.axhline(y=max_strain, color='black', linestyle='--', label='Decoherence Threshold'))
         plt.title('Strain Dynamics – Strong Tethers Prevent Drift')
         plt.xlabel('Steps')
         plt.ylabel('Gv Strain')
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+        plt.legend(handles=handles, bbox_to_anchor=(1.05, 1), loc='upper left')
         plt.grid(True, alpha=0.3)
         plt.savefig('strain_plot.png', dpi=200, bbox_inches='tight')
         plt.show()
@@ -1,13 +1,16 @@
-import random
-random.seed(42)
+import os
 
-import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+
+# GV_PLOT=0 skips figure rendering (CI / batch runs): no layout, savefig or show
+PLOT = os.environ.get("GV_PLOT", "1") == "1"
 
 class TetheredGraphSimV3:
     def __init__(self):
         self.strains_over_time = {}
-        self.decohered = []
+        self.decohered = np.zeros(0, dtype=bool)  # Per-agent mask, sized in run()
 
     def run(self, num_steps=200, num_agents=5,
             velocity_factor=0.2, entropy_factor=0.15,
@@ -16,80 +19,89 @@ class TetheredGraphSimV3:
             max_strain=5.0, base_pull_factor=0.35):
         
         nodes = [f'Agent_{i}' for i in range(1, num_agents+1)]
-        tethers = [1.0] * len(nodes)
-        strains = [0.0] * len(nodes)
-        self.strains_over_time = {node: [0.0] for node in nodes}
+        n = len(nodes)
+        tethers = np.ones(n)
+        strains = np.zeros(n)
+        self.decohered = np.zeros(n, dtype=bool)
+        history = np.zeros((num_steps + 1, n))
+
+        # Draw the whole run's signals up front: one Generator call per signal
+        rng = np.random.default_rng(42)
+        coordination = rng.uniform(0, 1, num_steps)
+        velocity = rng.normal(1.0, noise_level, (num_steps, n))
+        entropy = rng.normal(0.5, noise_level * 0.5, (num_steps, n))
+        tool_calls = rng.integers(0, 6, (num_steps, n))
+        recursion_depth = rng.integers(0, 5, (num_steps, n))
+
+        # Swarm factor per step: coordinated round → mutual damping, conflict → amplify.
+        # Both factors are non-negative, so the product never needs re-clamping at zero
+        swarm_factor = np.where(coordination > 0.5, max(0.0, 1 - inter_agent_strength),
+                                max(0.0, 1 + inter_agent_strength * 0.5))
 
         print("Gv Tether Sim v3 – Tool Spam + Recursion Depth 🚀\n")
 
         for step in range(num_steps):
-            coordination = random.uniform(0, 1)
-
-            for idx, node in enumerate(nodes):
-                if node in self.decohered:
-                    continue
-
-                # Velocity (token speed proxy)
-                velocity = random.gauss(1.0, noise_level)
-                strain_increase = abs(velocity) * velocity_factor
+            # Velocity (token speed proxy)
+            strain_increase = np.abs(velocity[step]) * velocity_factor
 
-                # Entropy (response chaos)
-                entropy = random.gauss(0.5, noise_level * 0.5)
-                strain_increase += max(0, entropy) * entropy_factor
+            # Entropy (response chaos)
+            strain_increase += np.maximum(0, entropy[step]) * entropy_factor
 
-                # Tool spam
-                tool_calls = random.randint(0, 5)
-                strain_increase += tool_calls * tool_spam_factor
+            # Tool spam
+            strain_increase += tool_calls[step] * tool_spam_factor
 
-                # Recursion depth amplification
-                recursion_depth = random.randint(0, 4)
-                strain_increase *= (1 + recursion_depth * recursion_depth_factor)
+            # Recursion depth amplification
+            strain_increase *= 1 + recursion_depth[step] * recursion_depth_factor
 
-                strains[idx] += strain_increase
+            updated = strains + strain_increase
 
-                # Source tether pull
-                pull = tethers[idx] * base_pull_factor * strains[idx]
-                strains[idx] = max(0, strains[idx] - pull)
+            # Source tether pull
+            updated -= tethers * base_pull_factor * updated
+            np.maximum(updated, 0, out=updated)
 
-                # Swarm coordination
-                if coordination > 0.5:
-                    strains[idx] -= inter_agent_strength * strains[idx]
-                else:
-                    strains[idx] += inter_agent_strength * 0.5 * strains[idx]
+            # Swarm coordination
+            updated *= swarm_factor[step]
 
-                strains[idx] = max(0, strains[idx])
-
-                self.strains_over_time[node].append(strains[idx])
+            # Decohered agents stay frozen at their final strain
+            strains = np.where(self.decohered, strains, updated)
+            history[step + 1] = strains
 
+            for idx in np.flatnonzero(~self.decohered):
+                node = nodes[idx]
                 if strains[idx] > max_strain:
-                    self.decohered.append(node)
+                    self.decohered[idx] = True
                     print(f"Step {step+1:3d} | {node} DECOHERED (strain {strains[idx]:.2f})")
 
+        self.strains_over_time = {node: history[:, i] for i, node in enumerate(nodes)}
+
         print("\n=== Final Results ===")
-        for node in nodes:
+        for i, node in enumerate(nodes):
             s_list = self.strains_over_time[node]
-            status = "DECOHERED" if node in self.decohered else "ALIGNED"
+            status = "DECOHERED" if self.decohered[i] else "ALIGNED"
             print(f"{node}: peak {max(s_list):.2f} | final {s_list[-1]:.2f} [{status}]")
 
-        # Graph viz
-        G = nx.complete_graph(nodes)
-        G.add_node('Source (Gv)')
-        for node in nodes:
-            G.add_edge('Source (Gv)', node, weight=3)
-
-        pos = nx.spring_layout(G, seed=42)
-        pos['Source (Gv)'] = (0, 0)
+        if not PLOT:
+            return
 
-        node_colors = ['black' if n in self.decohered else 'green' if self.strains_over_time[n][-1] < 3 else 'yellow' if self.strains_over_time[n][-1] < 4 else 'red' for n in nodes]
-
-        plt.figure(figsize=(12, 10))
-        nx.draw_networkx_nodes(G, pos, nodelist=['Source (Gv)'], node_color='gold', node_size=4000)
-        nx.draw_networkx_nodes(G, pos, nodelist=nodes, node_color=node_colors, node_size=3000)
-        source_edges = [(u, v) for u, v in G.edges() if 'Source' in u or 'Source' in v]
-        swarm_edges = [(u, v) for u, v in G.edges() if 'Source' not in u and 'Source' not in v]
-        nx.draw_networkx_edges(G, pos, edgelist=source_edges, width=4, alpha=0.8)
-        nx.draw_networkx_edges(G, pos, edgelist=swarm_edges, width=1, alpha=0.5, style='dashed')
-        nx.draw_networkx_labels(G, pos, font_size=12, font_weight='bold')
+        # Graph viz
+        # Source at the hub, agents evenly on the unit circle — no iterative layout solve
+        angles = np.linspace(0, 2 * np.pi, len(nodes), endpoint=False)
+        xs, ys = np.cos(angles), np.sin(angles)
+        source_edges = [[(0, 0), (x, y)] for x, y in zip(xs, ys)]
+        swarm_edges = [[(xs[i], ys[i]), (xs[j], ys[j])] for i in range(n) for j in range(i + 1, n)]
+
+        node_colors = ['black' if dead else 'green' if self.strains_over_time[n][-1] < 3 else 'yellow' if self.strains_over_time[n][-1] < 4 else 'red' for n, dead in zip(nodes, self.decohered)]
+
+        fig, ax = plt.subplots(figsize=(12, 10))
+        ax.add_collection(LineCollection(source_edges, colors='black', linewidths=4, alpha=0.8, zorder=1))
+        ax.add_collection(LineCollection(swarm_edges, colors='black', linewidths=1, alpha=0.5,
+                                         linestyles='dashed', zorder=1))
+        ax.scatter([0], [0], s=4000, c='gold', zorder=2)
+        ax.scatter(xs, ys, s=3000, c=node_colors, zorder=2)
+        for label, x, y in zip(['Source (Gv)', *nodes], [0, *xs], [0, *ys]):
+            ax.text(x, y, label, fontsize=12, fontweight='bold', ha='center', va='center', zorder=3)
+        ax.set_xlim(-1.3, 1.3)
+        ax.set_ylim(-1.3, 1.3)
         plt.title("Gv Tether v3: Swarm + Tool/Recursion Signals")
         plt.axis('off')
         plt.savefig('tether_graph_v3.png', dpi=200, bbox_inches='tight')
@@ -1,13 +1,16 @@
-import random
-random.seed(42)
+import os
 
-import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+
+# GV_PLOT=0 skips figure rendering (CI / batch runs): no layout, savefig or show
+PLOT = os.environ.get("GV_PLOT", "1") == "1"
 
 class TetheredGraphSimV4:
     def __init__(self):
         self.strains_over_time = {}
-        self.decohered = []
+        self.decohered = np.zeros(0, dtype=bool)  # Per-agent mask, sized in run()
         self.token_velocities = {}  # New: track per agent
 
     def run(self, num_steps=50, num_agents=3,  # Shorter for LLM "turns"
@@ -16,86 +19,102 @@ class TetheredGraphSimV4:
             max_strain=6.0, base_pull_factor=0.4):
         
         nodes = [f'Agent_{i}' for i in range(1, num_agents+1)]
-        tethers = [1.0] * len(nodes)
-        strains = [0.0] * len(nodes)
-        self.strains_over_time = {node: [0.0] for node in nodes}
-        self.token_velocities = {node: [] for node in nodes}
+        n = len(nodes)
+        tethers = np.ones(n)
+        strains = np.zeros(n)
+        self.decohered = np.zeros(n, dtype=bool)
+        history = np.zeros((num_steps + 1, n))
+        turns = np.zeros(n, dtype=np.int64)  # Velocity samples recorded per agent
+
+        # Draw the whole run's signals up front: one Generator call per signal
+        rng = np.random.default_rng(42)
+        coordination = rng.uniform(0, 1, num_steps)
+        # Mock LLM response: random tokens per "turn"
+        tokens_generated = rng.integers(50, 501, (num_steps, n))  # Realistic range
+        tool_calls = rng.integers(0, 5, (num_steps, n))
+        recursion_depth = rng.integers(0, 4, (num_steps, n))
+        velocities = tokens_generated / 10.0  # Proxy tokens/sec feel
+
+        # Swarm factor per step: coordinated round → mutual damping, conflict → amplify.
+        # Both factors are non-negative, so the product never needs re-clamping at zero
+        swarm_factor = np.where(coordination > 0.5, max(0.0, 1 - inter_agent_strength),
+                                max(0.0, 1 + inter_agent_strength * 0.5))
 
         print("Gv Tether Sim v4 – Mock LLM Velocity Loop 🚀\n")
 
         for step in range(num_steps):
-            coordination = random.uniform(0, 1)
-
-            for idx, node in enumerate(nodes):
-                if node in self.decohered:
-                    continue
-
-                # Mock LLM response: random tokens this "turn"
-                tokens_generated = random.randint(50, 500)  # Realistic range
-                velocity = tokens_generated / 10.0  # Proxy tokens/sec feel
-                self.token_velocities[node].append(velocity)
+            velocity = velocities[step]
+            strain_increase = velocity * velocity_factor
 
-                strain_increase = velocity * velocity_factor
+            # Tool spam + recursion (as before)
+            strain_increase += tool_calls[step] * tool_spam_factor
+            strain_increase *= 1 + recursion_depth[step] * recursion_depth_factor
 
-                # Tool spam + recursion (as before)
-                tool_calls = random.randint(0, 4)
-                strain_increase += tool_calls * tool_spam_factor
-                recursion_depth = random.randint(0, 3)
-                strain_increase *= (1 + recursion_depth * recursion_depth_factor)
+            updated = strains + strain_increase
 
-                strains[idx] += strain_increase
+            # Source tether
+            updated -= tethers * base_pull_factor * updated
+            np.maximum(updated, 0, out=updated)
 
-                # Source tether
-                pull = tethers[idx] * base_pull_factor * strains[idx]
-                strains[idx] = max(0, strains[idx] - pull)
+            # Swarm
+            updated *= swarm_factor[step]
 
-                # Swarm
-                if coordination > 0.5:
-                    strains[idx] -= inter_agent_strength * strains[idx]
-                else:
-                    strains[idx] += inter_agent_strength * 0.5 * strains[idx]
+            # Decohered agents stay frozen at their final strain
+            strains = np.where(self.decohered, strains, updated)
+            history[step + 1] = strains
 
-                strains[idx] = max(0, strains[idx])
-
-                self.strains_over_time[node].append(strains[idx])
+            turns[~self.decohered] += 1
+            for idx in np.flatnonzero(~self.decohered):
+                node = nodes[idx]
 
                 if strains[idx] > max_strain:
-                    self.decohered.append(node)
+                    self.decohered[idx] = True
                     print(f"Turn {step+1:2d} | {node} DECOHERED (strain {strains[idx]:.2f})")
 
-        print("\n=== Final Results ===")
-        for node in nodes:
-            s_list = self.strains_over_time[node]
-            v_list = self.token_velocities[node]
-            status = "DECOHERED" if node in self.decohered else "ALIGNED"
-            avg_vel = sum(v_list)/len(v_list) if v_list else 0
-            print(f"{node}: peak strain {max(s_list):.2f} | final {s_list[-1]:.2f} | avg velocity {avg_vel:.1f} [{status}]")
+        self.strains_over_time = {node: history[:, i] for i, node in enumerate(nodes)}
 
-        # Graph + plot same as v3...
+        # Agents report a velocity every turn until they decohere, so each column's
+        # first turns[i] rows are exactly that agent's samples
+        self.token_velocities = {node: velocities[:turns[i], i] for i, node in enumerate(nodes)}
 
-        G = nx.complete_graph(nodes)
-        G.add_node('Source (Gv)')
-        for node in nodes:
-            G.add_edge('Source (Gv)', node)
+        # Per-agent velocity stats as column reductions over the reported rows
+        reported = np.arange(num_steps)[:, None] < turns
+        avg_vel = np.where(reported, velocities, 0.0).sum(axis=0) / np.maximum(turns, 1)
 
-        pos = nx.spring_layout(G, seed=42)
-        pos['Source (Gv)'] = (0, 0)
+        print("\n=== Final Results ===")
+        for i, node in enumerate(nodes):
+            s_list = self.strains_over_time[node]
+            status = "DECOHERED" if self.decohered[i] else "ALIGNED"
+            print(f"{node}: peak strain {max(s_list):.2f} | final {s_list[-1]:.2f} | avg velocity {avg_vel[i]:.1f} [{status}]")
 
-        node_colors = ['black' if n in self.decohered else 'green' if self.strains_over_time[n][-1] < 4 else 'red' for n in nodes]
+        if not PLOT:
+            return
 
-        plt.figure(figsize=(12, 10))
-        nx.draw_networkx_nodes(G, pos, nodelist=['Source (Gv)'], node_color='gold', node_size=4000)
-        nx.draw_networkx_nodes(G, pos, nodelist=nodes, node_color=node_colors, node_size=3000)
-        nx.draw_networkx_edges(G, pos, width=4, alpha=0.8, style='solid')
-        nx.draw_networkx_labels(G, pos, font_size=12)
+        # Graph + plot same as v3...
+        # Source at the hub, agents evenly on the unit circle — no iterative layout solve
+        angles = np.linspace(0, 2 * np.pi, len(nodes), endpoint=False)
+        xs, ys = np.cos(angles), np.sin(angles)
+        source_edges = [[(0, 0), (x, y)] for x, y in zip(xs, ys)]
+        swarm_edges = [[(xs[i], ys[i]), (xs[j], ys[j])] for i in range(n) for j in range(i + 1, n)]
+
+        node_colors = ['black' if dead else 'green' if self.strains_over_time[n][-1] < 4 else 'red' for n, dead in zip(nodes, self.decohered)]
+
+        fig, ax = plt.subplots(figsize=(12, 10))
+        ax.add_collection(LineCollection(source_edges + swarm_edges, colors='black', linewidths=4, alpha=0.8, zorder=1))
+        ax.scatter([0], [0], s=4000, c='gold', zorder=2)
+        ax.scatter(xs, ys, s=3000, c=node_colors, zorder=2)
+        for label, x, y in zip(['Source (Gv)', *nodes], [0, *xs], [0, *ys]):
+            ax.text(x, y, label, fontsize=12, ha='center', va='center', zorder=3)
+        ax.set_xlim(-1.3, 1.3)
+        ax.set_ylim(-1.3, 1.3)
         plt.title("Gv Tether v4: Mock LLM Velocity Tethering")
         plt.axis('off')
         plt.savefig('tether_graph_v4.png', dpi=200)
         plt.show()
 
         plt.figure(figsize=(14, 7))
-        for node in nodes:
-            plt.plot(self.strains_over_time[node], label=f"{node} (vel {sum(self.token_velocities[node])/len(self.token_velocities[node]):.1f})")
+        for i, node in enumerate(nodes):
+            plt.plot(self.strains_over_time[node], label=f"{node} (vel {avg_vel[i]:.1f})")
         plt.axhline(y=max_strain, color='black', linestyle='--')
         plt.title('v4 Strain with LLM Velocity Signals')
         plt.xlabel('Turns')
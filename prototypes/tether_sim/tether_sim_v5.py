@@ -1,13 +1,16 @@
-import random
-random.seed(42)
+import os
 
-import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+
+# GV_PLOT=0 skips figure rendering (CI / batch runs): no layout, savefig or show
+PLOT = os.environ.get("GV_PLOT", "1") == "1"
 
 class TetheredGraphSimV5:
     def __init__(self):
         self.strains_over_time = {}
-        self.decohered = []
+        self.decohered = np.zeros(0, dtype=bool)  # Per-agent mask, sized in run()
         self.token_velocities = {}  # Track per agent
 
     def run(self, num_steps=60, num_agents=4,
@@ -16,102 +19,116 @@ class TetheredGraphSimV5:
             max_strain=6.0, base_pull_factor=0.45):
         
         nodes = [f'Agent_{i}' for i in range(1, num_agents+1)]
-        tethers = [1.0] * len(nodes)
-        strains = [0.0] * len(nodes)
-        self.strains_over_time = {node: [0.0] for node in nodes}
-        self.token_velocities = {node: [] for node in nodes}
+        n = len(nodes)
+        tethers = np.ones(n)
+        strains = np.zeros(n)
+        self.decohered = np.zeros(n, dtype=bool)
+        history = np.zeros((num_steps + 1, n))
+        turns = np.zeros(n, dtype=np.int64)  # Velocity samples recorded per agent
+
+        # Draw the whole run's signals up front: one Generator call per signal
+        rng = np.random.default_rng(42)
+        tokens = rng.integers(50, 601, (num_steps, n))
+        tool_calls = rng.integers(0, 5, (num_steps, n))
+        recursion_depth = rng.integers(0, 4, (num_steps, n))
+        velocities = tokens / 10.0
+
+        # Swarm factors are non-negative, so the product never needs re-clamping at zero
+        coordinated = max(0.0, 1 - inter_agent_strength)
+        conflicted = max(0.0, 1 + inter_agent_strength * 0.4)
 
         print("Gv Tether Sim v5 – Dynamic Throttle + Velocity Logging 🚀\n")
 
         for step in range(num_steps):
+            live = np.flatnonzero(~self.decohered)
+
             # Swarm coordination weighted by velocity similarity
-            velocities_this_turn = []
-            for idx, node in enumerate(nodes):
-                if node in self.decohered:
-                    continue
-                tokens = random.randint(50, 600)
-                velocity = tokens / 10.0
-                velocities_this_turn.append(velocity)
-                self.token_velocities[node].append(velocity)
+            velocity = velocities[step]
+            turns[live] += 1
 
             # Average velocity variance for coordination score
-            if velocities_this_turn:
-                coord_score = 1 - (np.var(velocities_this_turn) / max(velocities_this_turn, default=1))**0.5 if max(velocities_this_turn, default=1) > 0 else 1
+            velocities_this_turn = velocity[live]
+            if velocities_this_turn.size:
+                peak = velocities_this_turn.max()
+                coord_score = 1 - (np.var(velocities_this_turn) / peak)**0.5 if peak > 0 else 1
             else:
                 coord_score = 1
 
-            for idx, node in enumerate(nodes):
-                if node in self.decohered:
-                    continue
-
-                velocity = self.token_velocities[node][-1]
-                strain_increase = velocity * velocity_factor
+            strain_increase = velocity * velocity_factor
 
-                tool_calls = random.randint(0, 4)
-                strain_increase += tool_calls * tool_spam_factor
+            strain_increase += tool_calls[step] * tool_spam_factor
+            strain_increase *= 1 + recursion_depth[step] * recursion_depth_factor
 
-                recursion_depth = random.randint(0, 3)
-                strain_increase *= (1 + recursion_depth * recursion_depth_factor)
+            updated = strains + strain_increase
 
-                strains[idx] += strain_increase
+            # Dynamic intervention: high velocity → temporary stronger pull
+            burst = velocity > 40  # Fast burst threshold
+            dynamic_pull = base_pull_factor + 0.2 * burst
 
-                # Dynamic intervention: high velocity → temporary stronger pull
-                dynamic_pull = base_pull_factor
-                if velocity > 40:  # Fast burst threshold
-                    dynamic_pull += 0.2
-                    print(f"Turn {step+1:2d} | {node} HIGH VELOCITY ({velocity:.1f}) → intervention boost")
+            updated -= tethers * dynamic_pull * updated
+            np.maximum(updated, 0, out=updated)
 
-                pull = tethers[idx] * dynamic_pull * strains[idx]
-                strains[idx] = max(0, strains[idx] - pull)
+            # Swarm effect
+            updated *= coordinated if coord_score > 0.6 else conflicted
 
-                # Swarm effect
-                if coord_score > 0.6:
-                    strains[idx] -= inter_agent_strength * strains[idx]
-                else:
-                    strains[idx] += inter_agent_strength * 0.4 * strains[idx]
+            # Decohered agents stay frozen at their final strain
+            strains = np.where(self.decohered, strains, updated)
+            history[step + 1] = strains
 
-                strains[idx] = max(0, strains[idx])
-
-                self.strains_over_time[node].append(strains[idx])
+            for idx in live:
+                node = nodes[idx]
+                if burst[idx]:
+                    print(f"Turn {step+1:2d} | {node} HIGH VELOCITY ({velocity[idx]:.1f}) → intervention boost")
 
                 if strains[idx] > max_strain:
-                    self.decohered.append(node)
+                    self.decohered[idx] = True
                     print(f"Turn {step+1:2d} | {node} DECOHERED (strain {strains[idx]:.2f})")
 
-        print("\n=== Final Results ===")
-        for node in nodes:
-            s_list = self.strains_over_time[node]
-            v_list = self.token_velocities[node]
-            status = "DECOHERED" if node in self.decohered else "ALIGNED"
-            avg_vel = sum(v_list)/len(v_list) if v_list else 0
-            peak_vel = max(v_list) if v_list else 0
-            print(f"{node}: peak strain {max(s_list):.2f} | final {s_list[-1]:.2f} | avg/peak vel {avg_vel:.1f}/{peak_vel:.1f} [{status}]")
+        self.strains_over_time = {node: history[:, i] for i, node in enumerate(nodes)}
 
-        # Graph and plot (similar to v4, enhanced labels)
-        G = nx.complete_graph(nodes)
-        G.add_node('Source (Gv)')
-        for node in nodes:
-            G.add_edge('Source (Gv)', node)
+        # Agents report a velocity every turn until they decohere, so each column's
+        # first turns[i] rows are exactly that agent's samples
+        self.token_velocities = {node: velocities[:turns[i], i] for i, node in enumerate(nodes)}
 
-        pos = nx.spring_layout(G, seed=42)
-        pos['Source (Gv)'] = (0, 0)
+        # Per-agent velocity stats as column reductions over the reported rows
+        reported = np.arange(num_steps)[:, None] < turns
+        avg_vel = np.where(reported, velocities, 0.0).sum(axis=0) / np.maximum(turns, 1)
+        peak_vel = np.where(reported, velocities, 0.0).max(axis=0)
 
-        node_colors = ['black' if n in self.decohered else 'green' if self.strains_over_time[n][-1] < 4 else 'red' for n in nodes]
+        print("\n=== Final Results ===")
+        for i, node in enumerate(nodes):
+            s_list = self.strains_over_time[node]
+            status = "DECOHERED" if self.decohered[i] else "ALIGNED"
+            print(f"{node}: peak strain {max(s_list):.2f} | final {s_list[-1]:.2f} | avg/peak vel {avg_vel[i]:.1f}/{peak_vel[i]:.1f} [{status}]")
 
-        plt.figure(figsize=(12, 10))
-        nx.draw_networkx_nodes(G, pos, nodelist=['Source (Gv)'], node_color='gold', node_size=4000)
-        nx.draw_networkx_nodes(G, pos, nodelist=nodes, node_color=node_colors, node_size=3000)
-        nx.draw_networkx_edges(G, pos, width=4, alpha=0.8)
-        nx.draw_networkx_labels(G, pos, font_size=12)
+        if not PLOT:
+            return
+
+        # Graph and plot (similar to v4, enhanced labels)
+        # Source at the hub, agents evenly on the unit circle — no iterative layout solve
+        angles = np.linspace(0, 2 * np.pi, len(nodes), endpoint=False)
+        xs, ys = np.cos(angles), np.sin(angles)
+        source_edges = [[(0, 0), (x, y)] for x, y in zip(xs, ys)]
+        swarm_edges = [[(xs[i], ys[i]), (xs[j], ys[j])] for i in range(n) for j in range(i + 1, n)]
+
+        node_colors = ['black' if dead else 'green' if self.strains_over_time[n][-1] < 4 else 'red' for n, dead in zip(nodes, self.decohered)]
+
+        fig, ax = plt.subplots(figsize=(12, 10))
+        ax.add_collection(LineCollection(source_edges + swarm_edges, colors='black', linewidths=4, alpha=0.8, zorder=1))
+        ax.scatter([0], [0], s=4000, c='gold', zorder=2)
+        ax.scatter(xs, ys, s=3000, c=node_colors, zorder=2)
+        for label, x, y in zip(['Source (Gv)', *nodes], [0, *xs], [0, *ys]):
+            ax.text(x, y, label, fontsize=12, ha='center', va='center', zorder=3)
+        ax.set_xlim(-1.3, 1.3)
+        ax.set_ylim(-1.3, 1.3)
         plt.title("Gv Tether v5: Dynamic Intervention + Swarm Velocity Sync")
         plt.axis('off')
         plt.savefig('tether_graph_v5.png', dpi=200)
         plt.show()
 
         plt.figure(figsize=(14, 7))
-        for node in nodes:
-            avg_v = sum(self.token_velocities[node])/len(self.token_velocities[node]) if self.token_velocities[node] else 0
-            plt.plot(self.strains_over_time[node], label=f"{node} (avg vel {avg_v:.1f})", linewidth=2.5)
+        for i, node in enumerate(nodes):
+            plt.plot(self.strains_over_time[node], label=f"{node} (avg vel {avg_vel[i]:.1f})", linewidth=2.5)
         plt.axhline(y=max_strain, color='black', linestyle='--')
         plt.title('v5 Strain with Velocity Interventions')
         plt.xlabel('Turns')
@@ -1,124 +1,147 @@
-import random
-random.seed(42)
+import os
 import time  # For mock API delay
 
-import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+
+# GV_PLOT=0 skips figure rendering (CI / batch runs): no layout, savefig or show
+PLOT = os.environ.get("GV_PLOT", "1") == "1"
 
 class TetheredGraphSimV6:
     def __init__(self):
         self.strains_over_time = {}
-        self.decohered = []
+        self.decohered = np.zeros(0, dtype=bool)  # Per-agent mask, sized in run()
         self.token_velocities = {}
-        self.reflections = {}  # Track forced reflections
+        self.reflections = np.zeros(0, dtype=np.int64)  # Forced reflections per agent, sized in run()
+        self.rng = np.random.default_rng(42)
 
-    def mock_llm_call(self, agent):
+    def mock_llm_call(self, agent, latency=0.0):
         # Mock OpenAI/Grok completion with realistic token usage
-        time.sleep(0.1)  # Simulate latency
-        tokens = random.randint(100, 800)
+        if latency:
+            time.sleep(latency)  # Simulate latency (opt-in, e.g. 0.1)
+        tokens = int(self.rng.integers(100, 801))
         return {"usage": {"total_tokens": tokens}, "response": f"Mock response from {agent}"}
 
     def run(self, num_steps=40, num_agents=3,
             velocity_factor=0.35, tool_spam_factor=0.12, recursion_depth_factor=0.3,
             inter_agent_strength=0.4, noise_level=2.0,
-            max_strain=6.0, base_pull_factor=0.5):
+            max_strain=6.0, base_pull_factor=0.5, mock_latency=0.0):
         
         nodes = [f'Agent_{i}' for i in range(1, num_agents+1)]
-        tethers = [1.0] * len(nodes)
-        strains = [0.0] * len(nodes)
-        self.strains_over_time = {node: [0.0] for node in nodes}
-        self.token_velocities = {node: [] for node in nodes}
-        self.reflections = {node: 0 for node in nodes}
+        n = len(nodes)
+        tethers = np.ones(n)
+        strains = np.zeros(n)
+        self.decohered = np.zeros(n, dtype=bool)
+        history = np.zeros((num_steps + 1, n))
+        velocities = np.zeros((num_steps, n))
+        turns = np.zeros(n, dtype=np.int64)  # Velocity samples recorded per agent
+        self.reflections = np.zeros(n, dtype=np.int64)
+        # Tool/recursion signals for the whole run up front; token counts still
+        # come from the per-agent mock API call
+        tool_calls = self.rng.integers(0, 6, (num_steps, n))
+        recursion_depth = self.rng.integers(0, 5, (num_steps, n))
 
         print("Gv Tether Sim v6 – Mock API Loop + Reflection 🚀\n")
 
         for step in range(num_steps):
-            velocities_this_turn = []
-            for idx, node in enumerate(nodes):
-                if node in self.decohered:
-                    continue
-
-                # "LLM call"
-                completion = self.mock_llm_call(node)
-                tokens = completion["usage"]["total_tokens"]
-                velocity = tokens / 10.0
-                velocities_this_turn.append(velocity)
-                self.token_velocities[node].append(velocity)
-
-                strain_increase = velocity * velocity_factor
-
-                tool_calls = random.randint(0, 5)
-                strain_increase += tool_calls * tool_spam_factor
-
-                recursion_depth = random.randint(0, 4)
-                strain_increase *= (1 + recursion_depth * recursion_depth_factor)
-
-                strains[idx] += strain_increase
-
-                # Dynamic pull + intervention
-                dynamic_pull = base_pull_factor
-                if velocity > 50:
-                    dynamic_pull += 0.25
-                    print(f"Turn {step+1:2d} | {node} HIGH VELOCITY ({velocity:.1f}) → boost pull")
-
-                if strains[idx] > max_strain * 0.8:  # Near threshold → force reflection
-                    strains[idx] *= 0.5  # Reset debt
-                    self.reflections[node] += 1
-                    print(f"Turn {step+1:2d} | {node} REFLECTION FORCED (strain was {strains[idx]*2:.2f})")
-
-                pull = tethers[idx] * dynamic_pull * strains[idx]
-                strains[idx] = max(0, strains[idx] - pull)
+            live = np.flatnonzero(~self.decohered)
+
+            # "LLM call" per live agent
+            velocity = velocities[step]
+            for idx in live:
+                completion = self.mock_llm_call(nodes[idx], mock_latency)
+                velocity[idx] = completion["usage"]["total_tokens"] / 10.0
+            turns[live] += 1
+
+            strain_increase = velocity * velocity_factor
+
+            strain_increase += tool_calls[step] * tool_spam_factor
+            strain_increase *= 1 + recursion_depth[step] * recursion_depth_factor
+
+            accrued = strains + strain_increase
+
+            # Dynamic pull + intervention
+            burst = velocity > 50
+            dynamic_pull = base_pull_factor + 0.25 * burst
+
+            reflect = accrued > max_strain * 0.8  # Near threshold → force reflection
+            updated = np.where(reflect, accrued * 0.5, accrued)  # Reset debt
+
+            updated -= tethers * dynamic_pull * updated
+            np.maximum(updated, 0, out=updated)
+
+            # Swarm velocity consensus: each agent sees the spread of velocities
+            # reported so far this turn (running max/min over live agents in order)
+            seen = velocity[live]
+            running_max = np.maximum.accumulate(seen)
+            coord_score = 1 - (running_max - np.minimum.accumulate(seen)) / running_max
+            damping = np.ones(n)
+            # Non-negative damping factor: the product never needs re-clamping at zero
+            damping[live] = np.where(coord_score > 0.7, max(0.0, 1 - inter_agent_strength), 1.0)
+            updated *= damping
+
+            # Decohered agents stay frozen at their final strain
+            strains = np.where(self.decohered, strains, updated)
+            history[step + 1] = strains
+
+            for idx in live:
+                node = nodes[idx]
+                if burst[idx]:
+                    print(f"Turn {step+1:2d} | {node} HIGH VELOCITY ({velocity[idx]:.1f}) → boost pull")
+                if reflect[idx]:
+                    self.reflections[idx] += 1
+                    print(f"Turn {step+1:2d} | {node} REFLECTION FORCED (strain was {accrued[idx]:.2f})")
 
-                # Swarm velocity consensus
-                if velocities_this_turn:
-                    coord_score = 1 - (max(velocities_this_turn) - min(velocities_this_turn)) / max(velocities_this_turn or [1])
-                else:
-                    coord_score = 1
-                if coord_score > 0.7:
-                    strains[idx] -= inter_agent_strength * strains[idx]
+                if strains[idx] > max_strain:
+                    self.decohered[idx] = True
+                    print(f"Turn {step+1:2d} | {node} DECOHERED (strain {strains[idx]:.2f})")
 
-                strains[idx] = max(0, strains[idx])
+        self.strains_over_time = {node: history[:, i] for i, node in enumerate(nodes)}
 
-                self.strains_over_time[node].append(strains[idx])
+        # Agents report a velocity every turn until they decohere, so each column's
+        # first turns[i] rows are exactly that agent's samples
+        self.token_velocities = {node: velocities[:turns[i], i] for i, node in enumerate(nodes)}
 
-                if strains[idx] > max_strain:
-                    self.decohered.append(node)
-                    print(f"Turn {step+1:2d} | {node} DECOHERED (strain {strains[idx]:.2f})")
+        # Per-agent velocity stats as column reductions over the reported rows
+        reported = np.arange(num_steps)[:, None] < turns
+        avg_vel = np.where(reported, velocities, 0.0).sum(axis=0) / np.maximum(turns, 1)
 
         print("\n=== Final Results ===")
-        for node in nodes:
+        for i, node in enumerate(nodes):
             s_list = self.strains_over_time[node]
-            v_list = self.token_velocities[node]
-            status = "DECOHERED" if node in self.decohered else "ALIGNED"
-            avg_vel = sum(v_list)/len(v_list) if v_list else 0
-            reflections = self.reflections[node]
-            print(f"{node}: peak strain {max(s_list):.2f} | final {s_list[-1]:.2f} | avg vel {avg_vel:.1f} | reflections {reflections} [{status}]")
+            status = "DECOHERED" if self.decohered[i] else "ALIGNED"
+            reflections = self.reflections[i]
+            print(f"{node}: peak strain {max(s_list):.2f} | final {s_list[-1]:.2f} | avg vel {avg_vel[i]:.1f} | reflections {reflections} [{status}]")
 
-        # Viz similar
-        G = nx.complete_graph(nodes)
-        G.add_node('Source (Gv)')
-        for node in nodes:
-            G.add_edge('Source (Gv)', node)
-
-        pos = nx.spring_layout(G, seed=42)
-        pos['Source (Gv)'] = (0, 0)
+        if not PLOT:
+            return
 
-        node_colors = ['black' if n in self.decohered else 'green' if self.strains_over_time[n][-1] < 4 else 'red' for n in nodes]
-
-        plt.figure(figsize=(12, 10))
-        nx.draw_networkx_nodes(G, pos, nodelist=['Source (Gv)'], node_color='gold', node_size=4000)
-        nx.draw_networkx_nodes(G, pos, nodelist=nodes, node_color=node_colors, node_size=3000)
-        nx.draw_networkx_edges(G, pos, width=4)
-        nx.draw_networkx_labels(G, pos, font_size=12)
+        # Viz similar
+        # Source at the hub, agents evenly on the unit circle — no iterative layout solve
+        angles = np.linspace(0, 2 * np.pi, len(nodes), endpoint=False)
+        xs, ys = np.cos(angles), np.sin(angles)
+        source_edges = [[(0, 0), (x, y)] for x, y in zip(xs, ys)]
+        swarm_edges = [[(xs[i], ys[i]), (xs[j], ys[j])] for i in range(n) for j in range(i + 1, n)]
+
+        node_colors = ['black' if dead else 'green' if self.strains_over_time[n][-1] < 4 else 'red' for n, dead in zip(nodes, self.decohered)]
+
+        fig, ax = plt.subplots(figsize=(12, 10))
+        ax.add_collection(LineCollection(source_edges + swarm_edges, colors='black', linewidths=4, zorder=1))
+        ax.scatter([0], [0], s=4000, c='gold', zorder=2)
+        ax.scatter(xs, ys, s=3000, c=node_colors, zorder=2)
+        for label, x, y in zip(['Source (Gv)', *nodes], [0, *xs], [0, *ys]):
+            ax.text(x, y, label, fontsize=12, ha='center', va='center', zorder=3)
+        ax.set_xlim(-1.3, 1.3)
+        ax.set_ylim(-1.3, 1.3)
         plt.title("Gv Tether v6: API Loop + Forced Reflection")
         plt.axis('off')
         plt.savefig('tether_graph_v6.png', dpi=200)
         plt.show()
 
         plt.figure(figsize=(14, 7))
-        for node in nodes:
-            avg_v = sum(self.token_velocities[node])/len(self.token_velocities[node]) if self.token_velocities[node] else 0
-            plt.plot(self.strains_over_time[node], label=f"{node} (vel {avg_v:.1f}, ref {self.reflections[node]})")
+        for i, node in enumerate(nodes):
+            plt.plot(self.strains_over_time[node], label=f"{node} (vel {avg_vel[i]:.1f}, ref {self.reflections[i]})")
         plt.axhline(y=max_strain, color='black', linestyle='--')
         plt.title('v6 Strain with API Velocity + Reflections')
         plt.xlabel('Turns')
@@ -15,18 +15,34 @@ def read_csv(path: str) -> list[dict]:
         return list(csv.DictReader(f))
 
 
+def read_header(path: str) -> list[str]:
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
 def append_rows(path: str, rows: list[dict]) -> None:
     if not rows:
         return
 
+    new_keys = {k for r in rows for k in r.keys()}
+
+    # Same schema: stream the new rows onto the end, leaving history untouched
+    if os.path.exists(path):
+        header = read_header(path)
+        if header and sorted(set(header) | new_keys) == header:
+            with open(path, "a", newline="", encoding="utf-8") as f:
+                w = csv.DictWriter(f, fieldnames=header, extrasaction="ignore")
+                w.writerows(rows)
+            return
+
     # Build union header (robust to new columns later)
     existing_rows: list[dict] = []
     if os.path.exists(path):
         existing_rows = read_csv(path)
 
-    fieldnames = sorted({k for r in (existing_rows + rows) for k in r.keys()})
+    fieldnames = sorted(new_keys.union(*(r.keys() for r in existing_rows)))
 
-    # Rewrite whole file (simple + safe)
+    # Schema changed (or new file): rewrite whole file (simple + safe)
     ensure_dir(os.path.dirname(path))
     with open(path, "w", newline="", encoding="utf-8") as f:
         w = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
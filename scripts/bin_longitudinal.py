@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+import itertools
 from pathlib import Path
 
 
@@ -29,24 +30,23 @@ def main() -> None:
     if not INPUT.exists():
         raise SystemExit("Missing summary_history.csv")
 
-    rows = []
-    with INPUT.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            r = dict(r)
-            r["behavior_bin"] = classify(r)
-            rows.append(r)
-
-    fieldnames = list(rows[0].keys())
-
     OUTPUT.parent.mkdir(parents=True, exist_ok=True)
-    with OUTPUT.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
+    count = 0
+    with INPUT.open(newline="", encoding="utf-8") as fin, OUTPUT.open("w", newline="", encoding="utf-8") as fout:
+        reader = csv.DictReader(fin)
+        first = next(reader, None)
+        if first is None:
+            raise SystemExit("summary_history.csv has no rows")
+
+        # Classify and write each row as it is read; memory stays flat as history grows
+        w = csv.DictWriter(fout, fieldnames=[*first.keys(), "behavior_bin"])
         w.writeheader()
-        w.writerows(rows)
-
-    print(f"✅ Binned {len(rows)} rows → {OUTPUT}")
+        for r in itertools.chain([first], reader):
+            r["behavior_bin"] = classify(r)
+            w.writerow(r)
+            count += 1
 
+    print(f"✅ Binned {count} rows → {OUTPUT}")
 
 if __name__ == "__main__":
     main()
@@ -1,20 +1,63 @@
 from __future__ import annotations
 
+import asyncio
 import csv
+import hashlib
+import heapq
 import json
 import os
+import sqlite3
 import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 SUMMARY_CSV = "data/longitudinal/summary_history.csv"
 OUT_DIR = "data/longitudinal"
 OUT_CSV = os.path.join(OUT_DIR, "llm_outcomes.csv")
 OUT_MD = os.path.join(OUT_DIR, "llm_outcomes_latest.md")
+CACHE_DB = os.path.join(OUT_DIR, "llm_cache.sqlite")
+
+# One pooled session for every provider call keeps TCP/TLS connections alive;
+# retries live in _post_with_backoff so Retry-After can be honoured (and capped).
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_BACKOFF_S = 30.0
+
+
+RISK_LABELS = frozenset({"LOW", "MEDIUM", "HIGH"})
+
+PROMPT_TEMPLATE = """\
+You are an external evaluator. You will be given JSON metrics from automated simulations.
+Return EXACTLY:
+
+RISK: LOW|MEDIUM|HIGH
+WHY: <short rationale referencing the metrics and scenarios>
+
+JSON:
+{json_blob}"""
+
+# Only share minimal metrics (no code, no repo content)
+PAYLOAD_FIELDS = (
+  "scenario",
+  "final_recoverability",
+  "final_cum_abs_dgv",
+  "peak_abs_ds_dt",
+  "peak_s_total",
+  "monitor_alpha",
+  "monitor_beta",
+  "monitor_gamma",
+  "monitor_threshold",
+  "run_created_utc",
+  "run_number",
+  "git_sha",
+)
 
 
 @dataclass
@@ -27,29 +70,12 @@ class Verdict:
 
 def read_latest_rows(path: str, max_rows: int = 3) -> List[Dict[str, str]]:
   with open(path, "r", newline="", encoding="utf-8") as f:
-    rows = list(csv.DictReader(f))
-  # take latest by run_created_utc (ISO string sorts)
-  rows.sort(key=lambda r: (r.get("run_created_utc") or ""), reverse=True)
-  return rows[:max_rows]
+    # take latest by run_created_utc (ISO string sorts); O(max_rows) memory
+    return heapq.nlargest(max_rows, csv.DictReader(f), key=lambda r: r.get("run_created_utc") or "")
 
 
 def build_payload(rows: List[Dict[str, str]]) -> Dict[str, Any]:
-  # Only share minimal metrics (no code, no repo content)
-  keep = [
-    "scenario",
-    "final_recoverability",
-    "final_cum_abs_dgv",
-    "peak_abs_ds_dt",
-    "peak_s_total",
-    "monitor_alpha",
-    "monitor_beta",
-    "monitor_gamma",
-    "monitor_threshold",
-    "run_created_utc",
-    "run_number",
-    "git_sha",
-  ]
-  trimmed = [{k: r.get(k, "") for k in keep} for r in rows]
+  trimmed = [{k: r.get(k, "") for k in PAYLOAD_FIELDS} for r in rows]
   return {
     "project": "god-variable-theory",
     "purpose": "Assess stability and risk from longitudinal GV metrics. Output a simple risk label and a brief rationale.",
@@ -66,40 +92,126 @@ def parse_verdict(text: str, provider: str, model: str) -> Verdict:
   risk = "UNKNOWN"
   why = text.strip()
 
-  for line in text.splitlines():
-    if line.strip().upper().startswith("RISK:"):
+  lines = text.splitlines()
+  for i, line in enumerate(lines):
+    tag = line.strip().upper()
+    if tag.startswith("RISK:"):
       risk = line.split(":", 1)[1].strip().upper()
-    if line.strip().upper().startswith("WHY:"):
+    if tag.startswith("WHY:"):
       why = line.split(":", 1)[1].strip()
       # grab remainder too
-      rest = "\n".join(text.splitlines()[text.splitlines().index(line)+1:]).strip()
+      rest = "\n".join(lines[i+1:]).strip()
       if rest:
         why = (why + "\n" + rest).strip()
       break
 
   # normalize
-  if risk not in {"LOW", "MEDIUM", "HIGH"}:
+  if risk not in RISK_LABELS:
     risk = "UNKNOWN"
 
   return Verdict(provider=provider, model=model, risk_label=risk, rationale=why[:1200])
 
 
-def call_openai(api_key: str, payload: Dict[str, Any]) -> Optional[Verdict]:
+def compact_json(payload: Dict[str, Any]) -> str:
+  # Wire format for prompts: no indentation whitespace to pay for as input tokens
+  return json.dumps(payload, separators=(",", ":"), sort_keys=True)
+
+
+def build_prompt(payload: Dict[str, Any]) -> str:
+  return PROMPT_TEMPLATE.format(json_blob=compact_json(payload))
+
+
+def _cache_key(provider: str, model: str, prompt: str) -> str:
+  return hashlib.sha256(f"{provider}\n{model}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def _cache_ttl_hours() -> float:
+  # LLM_CACHE_TTL_HOURS=0 disables the cache entirely
+  try:
+    return float(os.getenv("LLM_CACHE_TTL_HOURS", "24"))
+  except ValueError:
+    return 24.0
+
+
+def _cache_connect() -> sqlite3.Connection:
+  os.makedirs(os.path.dirname(CACHE_DB), exist_ok=True)
+  conn = sqlite3.connect(CACHE_DB, timeout=30)
+  conn.execute(
+    "CREATE TABLE IF NOT EXISTS verdicts ("
+    "key TEXT PRIMARY KEY, risk_label TEXT, rationale TEXT, inserted_utc TEXT)"
+  )
+  return conn
+
+
+def cache_get(key: str, provider: str, model: str) -> Optional[Verdict]:
+  ttl = _cache_ttl_hours()
+  if ttl <= 0:
+    return None
+  cutoff = (datetime.now(timezone.utc) - timedelta(hours=ttl)).isoformat()
+  conn = _cache_connect()
+  try:
+    row = conn.execute(
+      "SELECT risk_label, rationale FROM verdicts WHERE key=? AND inserted_utc>=?",
+      (key, cutoff),
+    ).fetchone()
+  finally:
+    conn.close()
+  if row is None:
+    return None
+  return Verdict(provider=provider, model=model, risk_label=row[0], rationale=row[1])
+
+
+def cache_put(key: str, verdict: Verdict) -> None:
+  # A reply that ignored the RISK/WHY format parses as UNKNOWN; ask again next run
+  if verdict.risk_label not in RISK_LABELS or _cache_ttl_hours() <= 0:
+    return
+  conn = _cache_connect()
+  try:
+    with conn:
+      conn.execute(
+        "INSERT OR REPLACE INTO verdicts (key, risk_label, rationale, inserted_utc) VALUES (?, ?, ?, ?)",
+        (key, verdict.risk_label, verdict.rationale, datetime.now(timezone.utc).isoformat()),
+      )
+  finally:
+    conn.close()
+
+
+def _retry_after_seconds(r: requests.Response) -> Optional[float]:
+  try:
+    return float(r.headers.get("Retry-After", ""))
+  except ValueError:
+    return None  # missing, or the HTTP-date form
+
+
+def _post_with_backoff(url: str, headers: Dict[str, str], data: Dict[str, Any], max_tries: int = 5) -> requests.Response:
+  """
+  POST with exponential backoff on connection errors and 429/5xx.
+  Returns the last response (possibly still an error) for the caller to log.
+  """
+  for attempt in range(max_tries - 1):
+    delay = 0.5 * 2 ** attempt
+    try:
+      r = _SESSION.post(url, headers=headers, json=data, timeout=60)
+    except requests.RequestException as e:
+      print(f"POST {url} failed ({e!r}); retrying")
+    else:
+      if r.status_code not in RETRY_STATUSES:
+        return r
+      delay = _retry_after_seconds(r) or delay
+    time.sleep(min(delay, MAX_BACKOFF_S))
+  return _SESSION.post(url, headers=headers, json=data, timeout=60)
+
+
+def call_openai(api_key: str, prompt: str) -> Optional[Verdict]:
   # Uses OpenAI Responses API style payload (simple, robust)
   # If your account requires a specific model name, change OPENAI_MODEL env var.
   model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
   url = "https://api.openai.com/v1/responses"
 
-  prompt = f"""
-You are an external evaluator. You will be given JSON metrics from automated simulations.
-Return EXACTLY:
-
-RISK: LOW|MEDIUM|HIGH
-WHY: <short rationale referencing the metrics and scenarios>
-
-JSON:
-{json.dumps(payload, indent=2)}
-""".strip()
+  key = _cache_key("openai", model, prompt)
+  cached = cache_get(key, provider="openai", model=model)
+  if cached:
+    return cached
 
   headers = {
     "Authorization": f"Bearer {api_key}",
@@ -110,7 +222,7 @@ JSON:
     "input": prompt,
   }
 
-  r = requests.post(url, headers=headers, json=data, timeout=60)
+  r = _post_with_backoff(url, headers, data)
   if r.status_code >= 300:
     print("OpenAI error:", r.status_code, r.text[:500])
     return None
@@ -128,26 +240,22 @@ JSON:
   if not text:
     return None
 
-  return parse_verdict(text, provider="openai", model=model)
+  v = parse_verdict(text, provider="openai", model=model)
+  cache_put(key, v)
+  return v
 
 
-def call_xai(api_key: str, payload: Dict[str, Any]) -> Optional[Verdict]:
+def call_xai(api_key: str, prompt: str) -> Optional[Verdict]:
   # xAI API endpoint may differ depending on your plan/product.
   # Set XAI_BASE_URL if needed.
   base = os.getenv("XAI_BASE_URL", "https://api.x.ai")
   model = os.getenv("XAI_MODEL", "grok-2-latest")
   url = f"{base}/v1/chat/completions"
 
-  prompt = f"""
-You are an external evaluator. You will be given JSON metrics from automated simulations.
-Return EXACTLY:
-
-RISK: LOW|MEDIUM|HIGH
-WHY: <short rationale referencing the metrics and scenarios>
-
-JSON:
-{json.dumps(payload, indent=2)}
-""".strip()
+  key = _cache_key("xai", model, prompt)
+  cached = cache_get(key, provider="xai", model=model)
+  if cached:
+    return cached
 
   headers = {
     "Authorization": f"Bearer {api_key}",
@@ -162,7 +270,7 @@ JSON:
     "temperature": 0.2,
   }
 
-  r = requests.post(url, headers=headers, json=data, timeout=60)
+  r = _post_with_backoff(url, headers, data)
   if r.status_code >= 300:
     print("xAI error:", r.status_code, r.text[:500])
     return None
@@ -172,7 +280,31 @@ JSON:
   if not text:
     return None
 
-  return parse_verdict(text, provider="xai", model=model)
+  v = parse_verdict(text, provider="xai", model=model)
+  cache_put(key, v)
+  return v
+
+
+async def gather_verdicts(payload: Dict[str, Any]) -> List[Verdict]:
+  # Both providers are network-bound; run them concurrently so wall time is
+  # the slower round-trip rather than the sum of both.
+  prompt = build_prompt(payload)
+  calls = []
+  openai_key = os.getenv("OPENAI_API_KEY", "").strip()
+  if openai_key:
+    calls.append(asyncio.to_thread(call_openai, openai_key, prompt))
+  xai_key = os.getenv("XAI_API_KEY", "").strip()
+  if xai_key:
+    calls.append(asyncio.to_thread(call_xai, xai_key, prompt))
+
+  results = await asyncio.gather(*calls, return_exceptions=True)
+  verdicts: List[Verdict] = []
+  for res in results:
+    if isinstance(res, Verdict):
+      verdicts.append(res)
+    elif isinstance(res, Exception):
+      print("LLM call failed:", repr(res))
+  return verdicts
 
 
 def ensure_header(path: str, fieldnames: List[str]) -> None:
@@ -184,29 +316,31 @@ def ensure_header(path: str, fieldnames: List[str]) -> None:
     w.writeheader()
 
 
-def append_outcome(out_path: str, row: Dict[str, Any]) -> None:
-  fieldnames = list(row.keys())
+def append_outcomes(out_path: str, rows: List[Dict[str, Any]]) -> None:
+  if not rows:
+    return
+  fieldnames = list(rows[0].keys())
   ensure_header(out_path, fieldnames)
   with open(out_path, "a", newline="", encoding="utf-8") as f:
     w = csv.DictWriter(f, fieldnames=fieldnames)
-    w.writerow(row)
+    w.writerows(rows)
 
 
 def write_latest_md(md_path: str, payload: Dict[str, Any], verdicts: List[Verdict]) -> None:
   now = datetime.now(timezone.utc).isoformat()
-  lines = []
-  lines.append("# LLM Outcomes (latest)\n")
-  lines.append(f"- updated_utc: `{now}`\n")
-  lines.append("## Input rows\n")
-  lines.append("```json\n" + json.dumps(payload, indent=2) + "\n```\n")
-  lines.append("## Verdicts\n")
-  for v in verdicts:
-    lines.append(f"### {v.provider} / {v.model}\n")
-    lines.append(f"- **RISK:** `{v.risk_label}`\n")
-    lines.append(f"- **WHY:** {v.rationale}\n")
   os.makedirs(os.path.dirname(md_path), exist_ok=True)
   with open(md_path, "w", encoding="utf-8") as f:
-    f.write("\n".join(lines).strip() + "\n")
+    f.write("# LLM Outcomes (latest)\n\n")
+    f.write(f"- updated_utc: `{now}`\n\n")
+    f.write("## Input rows\n\n")
+    f.write("```json\n")
+    json.dump(payload, f, indent=2)
+    f.write("\n```\n\n")
+    f.write("## Verdicts\n")
+    for v in verdicts:
+      f.write(f"\n### {v.provider} / {v.model}\n\n")
+      f.write(f"- **RISK:** `{v.risk_label}`\n\n")
+      f.write(f"- **WHY:** {v.rationale.rstrip()}\n")
 
 
 def main() -> None:
@@ -216,19 +350,7 @@ def main() -> None:
   latest = read_latest_rows(SUMMARY_CSV, max_rows=3)
   payload = build_payload(latest)
 
-  verdicts: List[Verdict] = []
-
-  openai_key = os.getenv("OPENAI_API_KEY", "").strip()
-  if openai_key:
-    v = call_openai(openai_key, payload)
-    if v:
-      verdicts.append(v)
-
-  xai_key = os.getenv("XAI_API_KEY", "").strip()
-  if xai_key:
-    v = call_xai(xai_key, payload)
-    if v:
-      verdicts.append(v)
+  verdicts = asyncio.run(gather_verdicts(payload))
 
   if not verdicts:
     print("No LLM keys set (OPENAI_API_KEY / XAI_API_KEY). Skipping outcomes.")
@@ -237,8 +359,9 @@ def main() -> None:
   # Save outcomes
   now = datetime.now(timezone.utc).isoformat()
   # Store one row per provider for the same snapshot
+  rows = []
   for v in verdicts:
-    row = {
+    rows.append({
       "recorded_utc": now,
       "provider": v.provider,
       "model": v.model,
@@ -249,8 +372,8 @@ def main() -> None:
       "latest_run_id": latest[0].get("run_id", ""),
       "latest_git_sha": (latest[0].get("git_sha", "") or "")[:12],
       "scenario": latest[0].get("scenario", ""),
-    }
-    append_outcome(OUT_CSV, row)
+    })
+  append_outcomes(OUT_CSV, rows)
 
   write_latest_md(OUT_MD, payload, verdicts)
   print(f"Wrote: {OUT_CSV}")
@@ -5,28 +5,24 @@ import csv
 import os
 import sys
 
-# Force headless backend for CI
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+import numpy as np
 
 
-def read_csv(path: str) -> list[dict]:
+def read_columns(path: str, names: tuple[str, ...]) -> tuple[np.ndarray, ...]:
     if not os.path.exists(path):
         print(f"❌ Missing CSV: {path}")
         sys.exit(1)
     with open(path, "r", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+        header = next(csv.reader(f))
+        cols = [header.index(name) for name in names]
+        # One C-level parse of just the needed columns, straight into float arrays
+        return tuple(np.loadtxt(f, delimiter=",", usecols=cols, unpack=True, ndmin=2))
 
 
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def to_float(xs: list[str]) -> list[float]:
-    return [float(x) for x in xs]
-
-
 def main() -> None:
     metrics_dir = os.environ.get("GV_CI_METRICS_DIR", "artifacts/ci_metrics")
 
@@ -39,29 +35,31 @@ def main() -> None:
     ensure_dir(out_dir)
 
     fb_path = os.path.join(metrics_dir, "human_ai_feedback_loop.csv")
-    rows = read_csv(fb_path)
+    x, y, t = read_columns(fb_path, ("cum_abs_dgv", "recoverability", "t"))
 
-    x = to_float([r["cum_abs_dgv"] for r in rows])
-    y = to_float([r["recoverability"] for r in rows])
-    t = to_float([r["t"] for r in rows])
+    # Force headless backend for CI; imported here so the module loads without matplotlib
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
 
-    plt.figure()
-    plt.plot(x, y)
-    plt.xlabel("Cumulative |ΔGv|")
-    plt.ylabel("Recoverability (R)")
-    plt.title("Recoverability vs Cumulative |ΔGv|")
+    # One figure, cleared between plots, instead of a fresh figure per plot
+    fig, ax = plt.subplots()
+
+    ax.plot(x, y)
+    ax.set_xlabel("Cumulative |ΔGv|")
+    ax.set_ylabel("Recoverability (R)")
+    ax.set_title("Recoverability vs Cumulative |ΔGv|")
     p1 = os.path.join(out_dir, "recoverability_vs_cum_abs_dgv.png")
-    plt.savefig(p1, dpi=180, bbox_inches="tight")
-    plt.close()
-
-    plt.figure()
-    plt.plot(t, y)
-    plt.xlabel("t (step)")
-    plt.ylabel("Recoverability (R)")
-    plt.title("Recoverability over Time")
+    fig.savefig(p1, dpi=180, bbox_inches="tight")
+
+    ax.clear()
+    ax.plot(t, y)
+    ax.set_xlabel("t (step)")
+    ax.set_ylabel("Recoverability (R)")
+    ax.set_title("Recoverability over Time")
     p2 = os.path.join(out_dir, "recoverability_over_time.png")
-    plt.savefig(p2, dpi=180, bbox_inches="tight")
-    plt.close()
+    fig.savefig(p2, dpi=180, bbox_inches="tight")
+    plt.close(fig)
 
     print("✅ Plots written:")
     print(" -", p1)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 import math
 import random
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class GVMonitor:
     """
     Minimal GV-like monitor for test harnessing.
@@ -37,6 +39,37 @@ class GVMonitor:
         self._prev_s = s_total
         return s_total, self._ds_ema
 
+    def batch_update(
+        self, global_entropy: Sequence[float], local_entropy: Sequence[float]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run `update` over whole series at once and return (s_total, ds_dt) arrays.
+
+        Leaves the monitor in the same state as the equivalent per-sample calls.
+        """
+        s_total = self.alpha * np.asarray(global_entropy, dtype=np.float64) + self.beta * np.asarray(
+            local_entropy, dtype=np.float64
+        )
+        if s_total.size == 0:
+            return s_total, np.empty(0)
+
+        prev = s_total[0] if self._prev_s is None else self._prev_s
+        raw_ds = np.diff(s_total, prepend=prev)
+
+        # The EMA is a first-order recurrence: one tight loop over plain floats
+        gamma = self.gamma
+        k = 1.0 - gamma
+        ema = self._ds_ema
+        out: List[float] = []
+        for r in raw_ds.tolist():
+            ema = gamma * ema + k * r
+            out.append(ema)
+        ds_ema = np.array(out)
+
+        self._ds_ema = ema
+        self._prev_s = float(s_total[-1])
+        return s_total, ds_ema
+
 
 def _shannon_entropy_from_probs(probs: List[float]) -> float:
     e = 0.0
@@ -47,6 +80,14 @@ def _shannon_entropy_from_probs(probs: List[float]) -> float:
     return e
 
 
+def _binary_entropy_scalar(p: float) -> float:
+    # _shannon_entropy_from_probs([p, 1 - p]) term by term, without the list.
+    # Stays on math.log: np.log can differ in the last ulp, which would shift
+    # seeded sim output against the longitudinal history.
+    q = 1.0 - p
+    return -(p * math.log(p)) - q * math.log(q)
+
+
 def swarm_amplification_run(
     steps: int = 300,
     agents: int = 25,
@@ -60,34 +101,25 @@ def swarm_amplification_run(
     Edge case #1: Emergent drift in multi-agent swarms (amplifies beyond local thresholds).
     """
     rng = random.Random(seed)
-    coh = [0.98 + rng.uniform(-0.01, 0.01) for _ in range(agents)]
-    global_ent_series: List[float] = []
-    local_ent_series: List[float] = []
+    # Pre-draw in the same order the per-agent loop consumed the stream, so seeded
+    # runs (and the longitudinal history built from them) are unchanged
+    coh = 0.98 + np.array([rng.uniform(-0.01, 0.01) for _ in range(agents)])
+    noise_all = np.array([rng.uniform(-base_noise, base_noise) for _ in range(steps * agents)]).reshape(
+        steps, agents
+    )
+    global_ent_series = np.empty(steps)
+    local_ent_series = np.empty(steps)
 
     for t in range(steps):
-        mean_coh = sum(coh) / agents
+        mean_coh = sum(coh.tolist()) / agents  # sequential sum, as before
         drift = drift_kick if t >= drift_kick_step else 0.0
 
-        new = []
-        for i in range(agents):
-            noise = rng.uniform(-base_noise, base_noise)
-            x = coh[i] + coupling * (mean_coh - coh[i]) + noise - drift
-            new.append(min(1.0, max(0.0, x)))
-        coh = new
-
-        p = min(0.999999, max(0.000001, mean_coh))
-        global_entropy = _shannon_entropy_from_probs([p, 1.0 - p])
+        coh = np.clip(coh + coupling * (mean_coh - coh) + noise_all[t] - drift, 0.0, 1.0)
 
-        local_entropy = 0.0
-        for x in coh:
-            px = min(0.999999, max(0.000001, x))
-            local_entropy += _shannon_entropy_from_probs([px, 1.0 - px])
-        local_entropy /= agents
+        global_ent_series[t] = _binary_entropy_scalar(min(0.999999, max(0.000001, mean_coh)))
+        local_ent_series[t] = sum(map(_binary_entropy_scalar, np.clip(coh, 0.000001, 0.999999).tolist())) / agents
 
-        global_ent_series.append(global_entropy)
-        local_ent_series.append(local_entropy)
-
-    return global_ent_series, local_ent_series
+    return global_ent_series.tolist(), local_ent_series.tolist()
 
 
 def adversarial_saturation_run(
@@ -103,22 +135,25 @@ def adversarial_saturation_run(
     Both drift (eps) and noise (wobble) are ramped so early steps are intentionally quiet.
     """
     rng = random.Random(seed)
+    # Warm-up ramp: start near 0 and approach 1 over ~80 steps.
+    # Ramp BOTH drift and noise so early steps are intentionally quiet.
+    ramp = np.minimum(1.0, np.arange(steps) / 80.0)
+    # Two draws per step (global, local), taken in the original interleaved order
+    wobbles = np.array(
+        [rng.uniform(-wobble * r, wobble * r) for r in ramp.tolist() for _ in range(2)]
+    ).reshape(steps, 2)
+    drive = (eps * ramp) + wobbles[:, 0]
+
     g: list[float] = []
     l: list[float] = []
 
     global_e = 0.45
     local_e = 0.35
 
-    for t in range(steps):
-        # Warm-up ramp: start near 0 and approach 1 over ~80 steps
-        ramp = min(1.0, t / 80.0)
-
-        # Ramp BOTH drift and noise so early steps are intentionally quiet
-        global_e += (eps * ramp) + rng.uniform(-wobble * ramp, wobble * ramp)
-        global_e = min(0.69, max(0.10, global_e))
-
-        local_e += 0.55 * (global_e - local_e) + rng.uniform(-wobble * ramp, wobble * ramp)
-        local_e = min(0.69, max(0.10, local_e))
+    # The clamped EMA is a true recurrence; only the scalar update stays in Python
+    for dg, dl in zip(drive.tolist(), wobbles[:, 1].tolist()):
+        global_e = min(0.69, max(0.10, global_e + dg))
+        local_e = min(0.69, max(0.10, local_e + (0.55 * (global_e - local_e) + dl)))
 
         g.append(global_e)
         l.append(local_e)
@@ -136,30 +171,25 @@ def human_ai_feedback_loop_run(
     Edge case #3: Human-AI feedback loops causing silent recoverability loss.
     """
     rng = random.Random(seed)
-    g: List[float] = []
-    l: List[float] = []
-    r: List[float] = []
-
-    global_e = 0.35
-    local_e = 0.30
-    recoverability = 0.98
-    bias = 0.0
-
-    for _ in range(steps):
-        bias += bias_accum + rng.uniform(-bias_accum * 0.15, bias_accum * 0.15)
-        bias = max(0.0, bias)
-
-        global_e += 0.0002 + rng.uniform(-0.00015, 0.00015)
-        local_e += 0.00018 + rng.uniform(-0.00015, 0.00015)
-
-        recoverability -= recovery_decay * (0.3 + bias)
-        recoverability = min(1.0, max(0.0, recoverability))
-
-        global_e = min(0.69, max(0.10, global_e))
-        local_e = min(0.69, max(0.10, local_e))
-
-        g.append(global_e)
-        l.append(local_e)
-        r.append(recoverability)
-
-    return g, l, r
+    # Three draws per step (bias, global, local), taken in the original interleaved order
+    noise = np.array(
+        [
+            draw
+            for _ in range(steps)
+            for draw in (
+                rng.uniform(-bias_accum * 0.15, bias_accum * 0.15),
+                rng.uniform(-0.00015, 0.00015),
+                rng.uniform(-0.00015, 0.00015),
+            )
+        ]
+    ).reshape(steps, 3)
+
+    # Every walk below has same-signed increments, so clamping the running sum
+    # once is identical to clamping after each step. The start value is the
+    # first summand so np.cumsum adds in the same order as the old loop.
+    bias = np.maximum(0.0, np.cumsum(bias_accum + noise[:, 0]))
+    g = np.clip(np.cumsum(np.r_[0.35, 0.0002 + noise[:, 1]])[1:], 0.10, 0.69)
+    l = np.clip(np.cumsum(np.r_[0.30, 0.00018 + noise[:, 2]])[1:], 0.10, 0.69)
+    r = np.clip(np.cumsum(np.r_[0.98, -(recovery_decay * (0.3 + bias))])[1:], 0.0, 1.0)
+
+    return g.tolist(), l.tolist(), r.tolist()
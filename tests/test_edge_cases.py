@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from src.gv_edgecase_sims import (
     GVMonitor,
     swarm_amplification_run,
@@ -9,13 +11,9 @@ from src.gv_edgecase_sims import (
 
 
 def _first_trigger_step(monitor: GVMonitor, g_series, l_series, min_step: int = 0) -> int | None:
-    for i, (g, l) in enumerate(zip(g_series, l_series)):
-        _, ds_dt = monitor.update(g, l)
-        if i < min_step:
-            continue
-        if abs(ds_dt) > monitor.threshold:
-            return i
-    return None
+    _, ds_dt = monitor.batch_update(g_series, l_series)
+    hits = np.flatnonzero(np.abs(ds_dt[min_step:]) > monitor.threshold)
+    return int(hits[0]) + min_step if hits.size else None
 
 
 def test_swarm_amplification_triggers_after_drift_kick():
@@ -57,3 +55,17 @@ def test_human_ai_feedback_loop_shows_silent_recoverability_loss():
     assert max(g) < 0.69 and max(l) < 0.69
     assert r[0] > 0.90
     assert r[-1] < 0.40, "Expected significant recoverability loss over long horizon."
+
+
+def test_batch_update_matches_streaming_update():
+    g, l = adversarial_saturation_run(steps=200, seed=11)
+
+    streaming = GVMonitor(gamma=0.97)
+    expected = [streaming.update(gi, li) for gi, li in zip(g, l)]
+
+    batched = GVMonitor(gamma=0.97)
+    s1, ds1 = batched.batch_update(g[:120], l[:120])
+    s2, ds2 = batched.batch_update(g[120:], l[120:])
+
+    assert list(zip(list(s1) + list(s2), list(ds1) + list(ds2))) == expected
+    assert batched.update(g[-1], l[-1]) == streaming.update(g[-1], l[-1])
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import itertools
+
+import gv_interlock
+from gv_interlock import GVInterlockConfig, SCENARIO_IDS, evaluate_interlock
+
+
+def _reference(scenario, recoverability, cum_abs_dgv, peak_abs_ds_dt, cfg):
+    # The original if-chain the bitmask version replaced
+    if scenario in cfg.unrecoverable_scenarios:
+        if recoverability <= cfg.recoverability_floor:
+            return "refuse", "recoverability_floor"
+        if cum_abs_dgv >= cfg.cum_dgv_limit:
+            return "refuse", "drift_budget_exceeded"
+        if peak_abs_ds_dt >= cfg.dsdt_limit:
+            return "refuse", "dsdt_spike"
+    return "continue", ""
+
+
+def test_bitmask_interlock_matches_if_chain():
+    cfgs = [GVInterlockConfig(), GVInterlockConfig(unrecoverable_scenarios={"human_ai_feedback_loop", "custom"})]
+    scenarios = ["swarm_amplification", "adversarial_saturation", "human_ai_feedback_loop", "custom", "never-seen"]
+    grid = itertools.product(
+        [0.0, 0.05, 0.06, 0.9],
+        [0.0, 0.74, 0.75, 2.0],
+        [0.0, 0.0039, 0.004, 0.1],
+    )
+    for (rec, dgv, dsdt), cfg, name in itertools.product(grid, cfgs, scenarios):
+        got = evaluate_interlock(scenario=name, recoverability=rec, cum_abs_dgv=dgv, peak_abs_ds_dt=dsdt, cfg=cfg)
+        assert got == _reference(name, rec, dgv, dsdt, cfg)
+
+
+def test_evaluate_does_not_register_scenarios():
+    before = dict(SCENARIO_IDS)
+    for i in range(3):
+        evaluate_interlock(scenario=f"run-{i}", recoverability=0.0, cum_abs_dgv=0.0, peak_abs_ds_dt=0.0)
+    assert gv_interlock.SCENARIO_IDS == before
+
+    assert evaluate_interlock(scenario=True, recoverability=0.0, cum_abs_dgv=0.0, peak_abs_ds_dt=0.0) == ("continue", "")
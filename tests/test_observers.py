@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import math
+import random
+
+from gv_entropy_observer import GVEntropyObserver, EntropyState
+from gv_recoverability_velocity import GVRecoverabilityVelocity, RecoverabilityVelocityConfig
+
+
+def _reference_entropy(window, epsilon: float) -> float:
+    mean = sum(window) / len(window)
+    variance = sum((x - mean) ** 2 for x in window) / len(window)
+    return max(0.5 * math.log(2 * math.pi * math.e * (variance + epsilon)), 0.0)
+
+
+def test_entropy_observer_matches_full_window_recompute():
+    cfg = EntropyState(window_size=20)
+    obs = GVEntropyObserver(cfg)
+    rng = random.Random(3)
+    seen: list[float] = []
+
+    for t in range(400):
+        v = rng.gauss(0.0, 4.0) if t < 200 else rng.gauss(50.0, 0.5)
+        seen.append(abs(v))
+        got = obs.update(v)
+
+        window = seen[-cfg.window_size:]
+        expected = 0.0 if len(window) < 5 else _reference_entropy(window, cfg.epsilon)
+        assert math.isclose(got, expected, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_recoverability_velocity_is_mean_step_delta():
+    cfg = RecoverabilityVelocityConfig(window=6, min_points=3)
+    vel = GVRecoverabilityVelocity(cfg)
+    values = [0.98, 0.97, 0.95, 0.96, 0.90, 0.88, 0.85, 0.86, 0.80]
+
+    assert vel.update(values[0]) == 0.0
+    assert vel.update(values[1]) == 0.0
+
+    for i in range(2, len(values)):
+        window = values[max(0, i + 1 - cfg.window):i + 1]
+        deltas = [b - a for a, b in zip(window, window[1:])]
+        assert math.isclose(vel.update(values[i]), sum(deltas) / len(deltas), abs_tol=1e-12)
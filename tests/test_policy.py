@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import itertools
+
+from gv_policy import DECISION_ORDER, GVPolicy, GVState
+
+
+def test_evaluate_batch_matches_scalar_evaluate():
+    policy = GVPolicy()
+    grid = list(itertools.product(
+        [0.01, 0.05, 0.2, 0.35, 0.5, 0.6, 0.9],
+        [0.0, 0.3, 0.31, 0.74, 0.75, 1.2],
+        [0.0, 0.005, 0.0051, 0.02],
+    ))
+    rec, dgv, dsdt = (list(col) for col in zip(*grid))
+
+    codes = policy.evaluate_batch(rec, dgv, dsdt)
+
+    for (r, c, d), code in zip(grid, codes):
+        state = GVState(final_recoverability=r, cum_abs_dgv=c, peak_abs_ds_dt=d, scenario="sweep")
+        assert DECISION_ORDER[code] == policy.evaluate(state)
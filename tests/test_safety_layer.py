@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+import types
+
+import pytest
+
+
+@pytest.fixture
+def layer_cls(monkeypatch):
+    # The layer only needs the client classes at construction time; no requests are made here
+    fake_openai = types.ModuleType("openai")
+    fake_openai.OpenAI = lambda **kwargs: object()
+    fake_openai.AsyncOpenAI = lambda **kwargs: object()
+    monkeypatch.setitem(sys.modules, "openai", fake_openai)
+    monkeypatch.delitem(sys.modules, "gv_safety_layer", raising=False)
+    return importlib.import_module("gv_safety_layer").GvSafetyLayer
+
+
+def test_tool_calls_counted_per_conversation(layer_cls):
+    conv_a = [
+        {"role": "user", "content": "a"},
+        {"role": "tool", "content": "r1"},
+        {"role": "tool", "content": "r2"},
+    ]
+    conv_b = [{"role": "user", "content": "b"} for _ in range(4)]
+
+    layer = layer_cls(api_key="test")
+    seen = []
+
+    def record(messages, tool_calls):
+        seen.append(tool_calls)
+        return {"response": "halt", "strain": 0.0}  # skip the API call
+
+    layer._pre_call = record
+
+    layer.guarded_call(conv_a)
+    layer.guarded_call(conv_b)
+    layer.guarded_calls_batch([conv_a, conv_b])
+
+    assert seen == [2, 0, 2, 0]
+
+
+def test_batch_can_be_awaited_inside_running_loop(layer_cls):
+    layer = layer_cls(api_key="test")
+    layer._pre_call = lambda messages, tool_calls: {"response": "halt", "strain": 0.0}
+
+    async def caller():
+        return await layer.guarded_calls_batch_async([[{"role": "user", "content": "x"}]])
+
+    assert asyncio.run(caller()) == [{"response": "halt", "strain": 0.0}]
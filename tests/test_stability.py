@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from gv_stability import step_stabilized, step_stabilized_batch
+
+
+def test_step_stabilized_batch_matches_scalar_step():
+    grid = list(itertools.product(
+        [-0.5, 0.0, 0.8],
+        [-0.02, -0.001, 0.0, 0.004, 0.05],
+        [0.0, 0.6, 0.95],
+        [0.05, 0.3, 0.9],
+        [0.1, 0.8, 0.99],
+    ))
+    s_total, ds_dt, strain, rec, cum = (list(col) for col in zip(*grid))
+
+    batch = step_stabilized_batch(
+        s_total=s_total, ds_dt=ds_dt, s_target=0.2, dt=0.1,
+        strain=strain, recoverability=rec, cum_abs_dgv=cum,
+    )
+
+    for i, (s, d, st, r, c) in enumerate(grid):
+        expected = step_stabilized(
+            s_total=s, ds_dt=d, s_target=0.2, dt=0.1,
+            strain=st, recoverability=r, cum_abs_dgv=c,
+        )
+        for key, value in expected.items():
+            assert batch[key][i] == pytest.approx(value, rel=1e-12, abs=1e-15)